@@ -1,7 +1,9 @@
 """Abstract class for housing bots."""
 
+import threading
+
 from logging import Logger
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from selenium.webdriver.remote.webelement import WebElement
 
@@ -20,14 +22,95 @@ class AbstractHousingBot:
       logger (Logger): The logger for the bot.
 
     """
-    self.driver = WebDriverAdapter(config["selenium"])
+    self.bot_name = bot_name
+    self.selenium_config = config["selenium"]
+    self.driver = WebDriverAdapter(self.selenium_config)
     self.config = config[bot_name]
     self.logger = logger
+    self._config_lock = threading.Lock()
+    self._pending_config: Optional[Dict[str, Any]] = None
+    self._config_changed = threading.Event()
 
   def __del__(self) -> None:
     """Destructor for the bot."""
     self.driver.quit()
 
+  def update_config(self, config: Dict[str, Any]) -> None:
+    """Schedule a new configuration to be applied at the start of the next poll.
+
+    Args:
+      config (Dict[str, Any]): The full, already validated configuration.
+
+    """
+    if not config.get(self.bot_name):
+      self.logger.warning("%s section removed from the configuration, ignoring", self.bot_name)
+      return
+
+    with self._config_lock:
+      self._pending_config = config
+    self._config_changed.set()
+
+  def _requires_restart(self, config: Dict[str, Any]) -> bool:
+    """Check whether a new configuration can only be applied with a fresh driver.
+
+    Args:
+      config (Dict[str, Any]): The full new configuration.
+
+    Returns:
+      bool: True if the selenium options or the login details changed.
+
+    """
+    login_changed: bool = config[self.bot_name].get("login") != self.config.get("login")
+    return login_changed or config["selenium"] != self.selenium_config
+
+  def _apply_pending_config(self) -> Tuple[bool, bool]:
+    """Swap in a configuration scheduled with ``update_config``, if any.
+
+    The driver is only recreated (and the bot logged in again) when required by
+    ``_requires_restart``; every other change is picked up in place. A new driver that
+    fails to start or to log in is discarded, and the bot keeps running with its current
+    driver and configuration.
+
+    Returns:
+      Tuple[bool, bool]: Whether the configuration changed, and whether the driver restarted.
+
+    """
+    with self._config_lock:
+      config, self._pending_config = self._pending_config, None
+      self._config_changed.clear()
+
+    if config is None or (
+      config[self.bot_name] == self.config and config["selenium"] == self.selenium_config
+    ):
+      return False, False
+
+    restart = self._requires_restart(config)
+    if restart:
+      self.logger.info("Login or selenium settings changed, restarting the driver")
+      try:
+        driver = WebDriverAdapter(config["selenium"])
+        self._login(driver, config[self.bot_name])
+      except Exception as e:
+        self.logger.warning("Keeping the current configuration, the new one failed: %s", e)
+        return False, False
+      self.driver, old_driver = driver, self.driver
+      old_driver.quit()
+    else:
+      self.logger.info("Applied new configuration without restarting the driver")
+
+    self.selenium_config = config["selenium"]
+    self.config = config[self.bot_name]
+    return True, restart
+
+  def _wait_for_next_poll(self, poll_interval: float) -> None:
+    """Sleep until the next poll, waking up early when a new configuration arrives.
+
+    Args:
+      poll_interval (float): Seconds to wait.
+
+    """
+    self._config_changed.wait(poll_interval)
+
   def _serialize_str_to_housing_offer(self, input: str) -> HousingOffer:
     """Serialize a string to a HousingOffer object.
 
@@ -40,9 +123,16 @@ class AbstractHousingBot:
     """
     raise NotImplementedError
 
-  def _login(self) -> None:
+  def _login(
+    self, driver: Optional[WebDriverAdapter] = None, config: Optional[Dict[str, Any]] = None
+  ) -> None:
     """Login to the website.
 
+    Args:
+      driver (Optional[WebDriverAdapter]): The driver to log in, the bot's own driver by default.
+      config (Optional[Dict[str, Any]]): The bot configuration holding the login details, the
+        current one by default.
+
     Returns:
       None
 
@@ -1,9 +1,10 @@
 from logging import Logger
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from selenium.webdriver.remote.webelement import WebElement
 
 from home_rush.bots.abstract_bot import AbstractHousingBot
+from home_rush.utils.web_driver_adapter import WebDriverAdapter
 
 
 class Holland2StayBot(AbstractHousingBot):
@@ -13,7 +14,9 @@ class Holland2StayBot(AbstractHousingBot):
   def __del__(self):
     super().__del__()
 
-  def _login(self) -> None:
+  def _login(
+    self, driver: Optional[WebDriverAdapter] = None, config: Optional[Dict[str, Any]] = None
+  ) -> None:
     pass
 
   def _reply(self, item: WebElement) -> bool:
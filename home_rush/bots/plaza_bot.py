@@ -1,7 +1,12 @@
+import contextlib
+import http.client
+import math
+import operator
 import time
 
 from logging import Logger
-from typing import Any, Callable, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 from selenium.common.exceptions import (
   NoSuchElementException,
@@ -13,13 +18,40 @@ from selenium.webdriver.remote.webelement import WebElement
 
 from home_rush.bots.abstract_bot import AbstractHousingBot
 from home_rush.data.models import HousingOffer
+from home_rush.data.reply_queue import ReplyQueue
+from home_rush.utils.polling import ConditionalProbe, RateGovernor
+from home_rush.utils.profiling import profiler
+from home_rush.utils.reply_session import ReplySession
+from home_rush.utils.web_driver_adapter import WebDriverAdapter
 
 
 class PlazaBot(AbstractHousingBot):
+  PAGE_PARAM = "pagina"
+  REPLY_BUTTON_SELECTOR = "input.reageer-button[value='Reageer']"
+  LOGIN_BUTTON_XPATH = (
+    "//zds-navigation-link[contains(@class, 'hydrated')]//span[contains(text(), 'Login')]"
+    " | //zds-navigation-link[contains(@class, 'hydrated')]//zds-icon[@name='person_outline']"
+  )
+  MAX_SCROLLS = 5
+  LAZY_LOAD_TIMEOUT = 0.3
+  FIELD_MAPPING: ClassVar[Mapping[str, str]] = MappingProxyType(
+    {
+      "rent": "monthly_price",
+      "total_rent": "total_price",
+      "floor": "address.floor",
+      "size": "property_profile.size",
+    }
+  )
+  # Fields left at 0 when the listing does not show them; unlike the floor, 0 is never real.
+  REQUIRED_WHEN_RANKED: ClassVar[FrozenSet[str]] = frozenset({"rent", "total_rent", "size"})
+
   def __init__(self, config: Dict[str, Any], logger: Logger) -> None:
     super().__init__("plaza", config, logger)
+    self.reply_session: Optional[ReplySession] = None
+    self._reply_session_config: Optional[Dict[str, Any]] = None
 
   def __del__(self) -> None:
+    self._stop_reply_session()
     super().__del__()
 
   def _generate_location_url(self, location: tuple[str, str]) -> str:
@@ -63,7 +95,7 @@ class PlazaBot(AbstractHousingBot):
           price_str: str = stripped.replace("€", "").replace("p/m", "").replace(",", ".").strip()
           housing_offer.monthly_price = float(price_str)
         except ValueError:
-          self.logger.exception("Failed to convert monthly price to float", exc_info=stripped)
+          self.logger.warning("Failed to convert monthly price to float: %r", stripped)
       elif "Totale huurprijs:" in stripped:
         try:
           price_str: str = (
@@ -71,7 +103,7 @@ class PlazaBot(AbstractHousingBot):
           )
           housing_offer.total_price = float(price_str)
         except ValueError:
-          self.logger.exception("Failed to convert total price to float", exc_info=stripped)
+          self.logger.warning("Failed to convert total price to float: %r", stripped)
 
       elif index == 3:
         address_parts = stripped.split()
@@ -101,13 +133,13 @@ class PlazaBot(AbstractHousingBot):
               if floor_number:
                 housing_offer.address.floor = int(floor_number)
             except ValueError:
-              self.logger.exception("Failed to convert floor to int", exc_info=inner_segment)
+              self.logger.warning("Failed to convert floor to int: %r", inner_segment)
 
       elif "m²" in stripped:
         try:
           housing_offer.property_profile.size = float(stripped.replace("m²", "").strip())
         except ValueError:
-          self.logger.exception("Failed to convert size to float", exc_info=stripped)
+          self.logger.warning("Failed to convert size to float: %r", stripped)
 
       elif "gereageerd" in stripped.lower():
         housing_offer.responded = True
@@ -138,14 +170,7 @@ class PlazaBot(AbstractHousingBot):
 
         filters["complexes"] = complexes_filter
 
-    field_mapping = {
-      "rent": "monthly_price",
-      "total_rent": "total_price",
-      "floor": "address.floor",
-      "size": "property_profile.size",
-    }
-
-    for config_field, obj_field in field_mapping.items():
+    for config_field, obj_field in self.FIELD_MAPPING.items():
       if config_field in filter_config:
         field_config: Dict[str, Any] = filter_config[config_field]
 
@@ -161,7 +186,7 @@ class PlazaBot(AbstractHousingBot):
                 return getattr(attr, parts[1]) == val
               return getattr(offer, field_path) == val
             except AttributeError as e:
-              self.logger.exception("Attribute error in eq_filter: %s", e)
+              self.logger.warning("Attribute error in eq_filter: %s", e)
               return False
 
           filters[f"{config_field}_eq"] = eq_filter
@@ -180,7 +205,7 @@ class PlazaBot(AbstractHousingBot):
                 return getattr(attr, parts[1]) >= val
               return getattr(offer, field_path) >= val
             except AttributeError as e:
-              self.logger.exception("Attribute error in min_filter: %s", e)
+              self.logger.warning("Attribute error in min_filter: %s", e)
               return False
 
           filters[f"{config_field}_min"] = min_filter
@@ -199,22 +224,67 @@ class PlazaBot(AbstractHousingBot):
                 return getattr(attr, parts[1]) <= val
               return getattr(offer, field_path) <= val
             except AttributeError as e:
-              self.logger.exception("Attribute error in max_filter: %s", e)
+              self.logger.warning("Attribute error in max_filter: %s", e)
               return False
 
           filters[f"{config_field}_max"] = max_filter
 
     return filters
 
+  def _parse_ranking(self, config: Dict[str, Any]) -> Callable[[HousingOffer], float]:
+    """Parse the ranking configuration into a scoring function.
+
+    The score is the weighted sum of the configured fields plus the bonus of the offer's
+    complex. Without a ranking configuration every offer scores 0 and keeps page order.
+    Offers missing a weighted rent, total rent or size could not be compared fairly, so
+    they sink to the end of the queue.
+
+    Args:
+        config: The configuration dictionary containing the ranking specification
+
+    Returns:
+        Function taking an offer and returning its score, higher being replied to first
+
+    """
+    ranking_config: Dict[str, Any] = config.get("target", {}).get("ranking", {}) or {}
+    weights: Dict[str, float] = ranking_config.get("weights", {}) or {}
+    complexes: Dict[str, float] = ranking_config.get("complexes", {}) or {}
+
+    getters: List[Tuple[Callable[[HousingOffer], Any], float, bool]] = [
+      (
+        operator.attrgetter(self.FIELD_MAPPING[field]),
+        weight,
+        field in self.REQUIRED_WHEN_RANKED,
+      )
+      for field, weight in weights.items()
+      if field in self.FIELD_MAPPING
+    ]
+    if weights or complexes:
+      self.logger.info("Ranking by weights %s and complexes %s", weights, complexes)
+
+    def score(offer: HousingOffer) -> float:
+      total: float = complexes.get(offer.address.street, 0.0)
+      for getter, weight, required in getters:
+        value: float = getter(offer)
+        if required and not value:
+          return -math.inf
+        total += weight * value
+      return total
+
+    return score
+
   @staticmethod
   def _apply_filters(
-    items: List[Tuple[WebElement, HousingOffer]], filters: Dict[str, Callable[[HousingOffer], bool]]
+    items: List[Tuple[WebElement, HousingOffer]],
+    filters: Dict[str, Callable[[HousingOffer], bool]],
+    on_match: Optional[Callable[[HousingOffer], None]] = None,
   ) -> List[Tuple[WebElement, HousingOffer]]:
     """Apply the provided filters to the list of items.
 
     Args:
         items: List of tuples containing raw elements and their corresponding offer objects
         filters: Dictionary of filter functions to apply
+        on_match: Optional callback invoked with each match as soon as it is found
 
     Returns:
         Filtered list of item pairs that match all criteria
@@ -238,26 +308,33 @@ class PlazaBot(AbstractHousingBot):
 
       if matches:
         result.append((raw_item, offer))
+        if on_match is not None:
+          on_match(offer)
 
     return result
 
-  def _login(self) -> None:
-    """Log in to the website and return the authenticated driver.
+  def _login(
+    self, driver: Optional[WebDriverAdapter] = None, config: Optional[Dict[str, Any]] = None
+  ) -> None:
+    """Log in to the website.
 
     Args:
-      config (dict): Configuration dictionary containing login URL, username, password, and Selenium settings.
-      logger (Logger): Logger instance for logging messages.
+      driver (Optional[WebDriverAdapter]): The driver to log in, the bot's own driver by default.
+      config (Optional[Dict[str, Any]]): The bot configuration holding the login details, the
+        current one by default.
 
     Raises:
       Exception: If login fails due to element not found or not interactable.
 
     """
+    driver = driver or self.driver
+    login: Dict[str, str] = (config or self.config)["login"]
     try:
-      self.driver.get(self.config["login"]["url"])
+      driver.get(login["url"])
 
       # Step 1: Accept cookies if the banner is present
       try:
-        accept_cookies_button = self.driver.wait_for_element_to_be_clickable(
+        accept_cookies_button = driver.wait_for_element_to_be_clickable(
           By.CSS_SELECTOR, "button#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll"
         )
         accept_cookies_button.click()
@@ -266,10 +343,7 @@ class PlazaBot(AbstractHousingBot):
 
       # Step 2: Click the login button
       try:
-        login_button = self.driver.wait_for_element_to_be_clickable(
-          By.XPATH,
-          "//zds-navigation-link[contains(@class, 'hydrated')]//span[contains(text(), 'Login')] | //zds-navigation-link[contains(@class, 'hydrated')]//zds-icon[@name='person_outline']",
-        )
+        login_button = driver.wait_for_element_to_be_clickable(By.XPATH, self.LOGIN_BUTTON_XPATH)
         login_button.click()
       except TimeoutException:
         self.logger.exception("Login button not found or not interactable.")
@@ -277,8 +351,8 @@ class PlazaBot(AbstractHousingBot):
 
       # Step 3: Fill in the username
       try:
-        username_field = self.driver.wait_for_element_to_be_visible(By.ID, "username")
-        username_field.send_keys(self.config["login"]["username"])
+        username_field = driver.wait_for_element_to_be_visible(By.ID, "username")
+        username_field.send_keys(login["username"])
       except TimeoutException:
         self.logger.exception("Username field not found.")
         raise
@@ -287,15 +361,15 @@ class PlazaBot(AbstractHousingBot):
 
       # Step 4: Fill in the password
       try:
-        password_field = self.driver.wait_for_element_to_be_visible(By.ID, "password")
-        password_field.send_keys(self.config["login"]["password"])
+        password_field = driver.wait_for_element_to_be_visible(By.ID, "password")
+        password_field.send_keys(login["password"])
       except TimeoutException:
         self.logger.exception("Password field not found.")
         raise
 
       # Step 5: Submit the form
       try:
-        submit_button = self.driver.wait_for_element_to_be_clickable(
+        submit_button = driver.wait_for_element_to_be_clickable(
           By.CSS_SELECTOR, "input[type='submit']"
         )
         submit_button.click()
@@ -305,7 +379,7 @@ class PlazaBot(AbstractHousingBot):
 
       # Step 6: Wait for login to complete
       try:
-        self.driver.wait_for_url_change(self.config["login"]["url"])
+        driver.wait_for_url_change(login["url"])
         self.logger.info("Logged in successfully!")
       except TimeoutException:
         self.logger.warning("Login might have failed. Check the page after submission.")
@@ -313,23 +387,63 @@ class PlazaBot(AbstractHousingBot):
 
     except Exception as e:
       self.logger.exception("Login failed", exc_info=e)
-      self.driver.quit()
+      driver.quit()
       raise
 
+  def _is_logged_in(self, driver: WebDriverAdapter) -> bool:
+    """Check whether the page shown by a driver belongs to a logged in session.
+
+    Args:
+      driver (WebDriverAdapter): The driver to check.
+
+    Returns:
+      bool: False if the page offers to log in, True otherwise.
+
+    Raises:
+      TimeoutException: If the navigation bar does not render.
+
+    """
+    # Wait for the navigation bar rather than for the login button, which is absent when
+    # the session is healthy
+    driver.wait_for_element_to_be_visible(By.CSS_SELECTOR, "zds-navigation-link.hydrated")
+    return not driver.find_elements(By.XPATH, self.LOGIN_BUTTON_XPATH)
+
   def _reply(self, item: WebElement, offer: HousingOffer) -> None:
-    """Clicks on the item, clicks the 'Reply' button, and returns to the original page.
+    """Open the offer, click the 'Reply' button, and return to the original page.
+
+    The offer is opened through its detail URL when known, since items harvested from
+    other result pages are no longer attached to the listing tab.
+    With a ready reply session, the reply is sent from its warm browser instead; the
+    listing browser only takes over when the session browser itself fails.
 
     Args:
       item (WebElement): The web element representing the item to reply to.
       offer (HousingOffer): The housing offer object being replied to.
+
     """
     self.logger.info("Replying to offer: %s", offer)
+    if self.reply_session is not None and self.reply_session.ready and offer.url:
+      try:
+        self._reply_from_session(offer)
+      except (TimeoutException, NoSuchElementException, StaleElementReferenceException):
+        # The offer page is at fault (e.g. withdrawn or already answered), not the browser
+        self.logger.exception("Failed to find or click the 'Reply' button")
+        raise
+      except Exception as e:
+        self.logger.warning("Reply session failed, replying from the listing: %s", e)
+        self.reply_session.restart()
+      else:
+        return
+
     try:
       parent: str = self.driver.get_current_url()
-      self.driver.scroll_into_view(item)
-      item.click()
+      if offer.url:
+        self.driver.get(offer.url)
+      else:
+        self.driver.scroll_into_view(item)
+        item.click()
       reply_button = self.driver.wait_for_element_to_be_clickable(
-        By.CSS_SELECTOR, "input.reageer-button[value='Reageer']"
+        By.CSS_SELECTOR, self.REPLY_BUTTON_SELECTOR
       )
       self.driver.scroll_into_view(reply_button)
       time.sleep(0.5)
@@ -350,66 +464,402 @@ class PlazaBot(AbstractHousingBot):
     finally:
       self.driver.get(parent)
 
+  def _reply_from_session(self, offer: HousingOffer) -> None:
+    """Reply to an offer from the warm reply session, using its prefetched tab if any.
+
+    Args:
+      offer (HousingOffer): The housing offer object being replied to.
+
+    """
+    with self.reply_session.open(offer.url) as driver:
+      reply_button = driver.wait_for_element_to_be_clickable(
+        By.CSS_SELECTOR, self.REPLY_BUTTON_SELECTOR
+      )
+      driver.dismiss_dialog()
+      driver.js_click(reply_button)
+      time.sleep(0.5)
+    self.logger.info("Replied!")
+
+  def _prefetch_offer(self, offer: HousingOffer) -> None:
+    """Preload the detail page of a matching offer in the reply session.
+
+    Args:
+      offer (HousingOffer): The matching offer.
+
+    """
+    if self.reply_session is None or not self.reply_session.ready or not offer.url:
+      return
+    try:
+      self.reply_session.prefetch(offer.url)
+    except Exception as e:
+      self.logger.warning("Failed to prefetch %s: %s", offer.url, e)
+
+  def _start_reply_session(self) -> None:
+    """(Re)start the reply session if the ``reply_session`` setting enables it."""
+    self._stop_reply_session()
+    self._reply_session_config = self.config.get("reply_session")
+    if not self._reply_session_config:
+      return
+
+    session = ReplySession(
+      self.selenium_config,
+      self._login,
+      self._is_logged_in,
+      self.logger,
+      keep_alive_interval=self._reply_session_config.get("keep_alive_interval", 120),
+    )
+    try:
+      session.start()
+    except Exception as e:
+      self.logger.exception(
+        "Failed to start the reply session, replying from the listing", exc_info=e
+      )
+      session.stop()
+      return
+    self.reply_session = session
+
+  def _stop_reply_session(self) -> None:
+    """Close the reply session, if one is running."""
+    if getattr(self, "reply_session", None) is not None:
+      self.reply_session.stop()
+      self.reply_session = None
+
+  def _page_url(self, location_url: str, page: int) -> str:
+    """Build the URL of a given result page.
+
+    Args:
+      location_url (str): The URL of the first result page.
+      page (int): The 1-based page number.
+
+    Returns:
+      str: The URL of the requested page.
+
+    """
+    return f"{location_url}&{self.PAGE_PARAM}={page}"
+
+  def _get_page_count(self) -> int:
+    """Read the number of result pages from the pagination control of the current tab.
+
+    Returns:
+      int: The number of result pages, 1 if the results are not paginated.
+
+    """
+    numbers: List[int] = [
+      int(link.text)
+      for link in self.driver.find_elements(By.CSS_SELECTOR, "ul.pagination li a")
+      if link.text.strip().isdigit()
+    ]
+    return max(numbers, default=1)
+
+  def _read_offers(self) -> List[Tuple[WebElement, HousingOffer]]:
+    """Read every offer of the result page in the current tab.
+
+    Pages whose bottom is already in view are read as they are. Others are scrolled down
+    until no further items are lazily loaded, continuing as soon as new items appear.
+
+    Returns:
+      List[Tuple[WebElement, HousingOffer]]: The raw items and their parsed offers.
+
+    """
+    list_container = self.driver.wait_for_element_to_be_visible(
+      By.CSS_SELECTOR, "div.object-list-items-container"
+    )
+    raw_items: List[WebElement] = list_container.find_elements(By.CSS_SELECTOR, "section.list-item")
+
+    for _ in range(self.MAX_SCROLLS):
+      if self.driver.is_scrolled_to_bottom():
+        break
+      self.driver.scroll_to_bottom()
+      more_items: List[WebElement] = self.driver.wait_for_element_count_change(
+        list_container, By.CSS_SELECTOR, "section.list-item", len(raw_items), self.LAZY_LOAD_TIMEOUT
+      )
+      if len(more_items) == len(raw_items):
+        break
+      raw_items = more_items
+
+    pairs: List[Tuple[WebElement, HousingOffer]] = []
+    for raw_item in raw_items:
+      offer = self._serialize_str_to_housing_offer(raw_item.text)
+      with contextlib.suppress(NoSuchElementException):
+        offer.url = raw_item.find_element(By.CSS_SELECTOR, "a").get_attribute("href") or ""
+      pairs.append((raw_item, offer))
+    return pairs
+
+  def _read_page(self, page: int) -> List[Tuple[WebElement, HousingOffer]]:
+    """Read the result page in the current tab, logging instead of raising on failure.
+
+    Args:
+      page (int): The 1-based page number, for the log.
+
+    Returns:
+      List[Tuple[WebElement, HousingOffer]]: The raw items and their parsed offers, empty
+        if the page failed to load or changed while being read.
+
+    """
+    try:
+      return self._read_offers()
+    except (TimeoutException, NoSuchElementException, StaleElementReferenceException):
+      self.logger.warning("Failed to read result page %d", page)
+      return []
+
+  def _harvest_offers(self, location_url: str) -> List[Tuple[WebElement, HousingOffer]]:
+    """Collect the offers of every result page into a single deduplicated batch.
+
+    The other result pages are opened in background tabs before the first page is read,
+    so they load concurrently. Once the first page is read, every other tab is scrolled
+    down so their lazily loaded items also arrive concurrently, and the whole harvest takes
+    about as long as one page.
+
+    Args:
+      location_url (str): The URL of the first result page, open in the current tab.
+
+    Returns:
+      List[Tuple[WebElement, HousingOffer]]: The raw items and their parsed offers.
+
+    """
+    self.driver.wait_for_element_to_be_visible(By.CSS_SELECTOR, "div.object-list-items-container")
+    page_count: int = self._get_page_count()
+    listing_tab: str = self.driver.get_current_tab()
+    page_tabs: List[str] = [
+      self.driver.open_tab(self._page_url(location_url, page)) for page in range(2, page_count + 1)
+    ]
+
+    pairs: List[Tuple[WebElement, HousingOffer]] = []
+    try:
+      pairs.extend(self._read_page(1))
+      for tab in page_tabs:
+        self.driver.switch_to_tab(tab)
+        self.driver.scroll_to_bottom()
+      for page, tab in enumerate(page_tabs, start=2):
+        self.driver.switch_to_tab(tab)
+        pairs.extend(self._read_page(page))
+    finally:
+      for tab in page_tabs:
+        self.driver.close_tab(tab, listing_tab)
+
+    unique: List[Tuple[WebElement, HousingOffer]] = self._deduplicate(pairs)
+    self.logger.info("Harvested %d offers from %d pages", len(unique), page_count)
+    return unique
+
+  @staticmethod
+  def _deduplicate(
+    pairs: List[Tuple[WebElement, HousingOffer]],
+  ) -> List[Tuple[WebElement, HousingOffer]]:
+    """Drop offers listed on several result pages, keeping their first occurrence.
+
+    Offers are identified by their detail URL, or by their description when it is unknown.
+
+    Args:
+      pairs (List[Tuple[WebElement, HousingOffer]]): The raw items and their parsed offers.
+
+    Returns:
+      List[Tuple[WebElement, HousingOffer]]: The pairs without duplicates, in page order.
+
+    """
+    unique: Dict[str, Tuple[WebElement, HousingOffer]] = {}
+    for raw_item, offer in pairs:
+      unique.setdefault(offer.url or str(offer), (raw_item, offer))
+    return list(unique.values())
+
+  def _poll(
+    self,
+    location_url: str,
+    filters: Dict[str, Callable[[HousingOffer], bool]],
+    score: Callable[[HousingOffer], float],
+  ) -> bool:
+    """Read the offers on every result page and reply to the matching ones, best first.
+
+    Args:
+      location_url (str): The URL of the first result page, open in the current tab.
+      filters (Dict[str, Callable[[HousingOffer], bool]]): The filter functions to apply.
+      score (Callable[[HousingOffer], float]): Ranks the matching offers.
+
+    Returns:
+      bool: False if the result list failed to load, True otherwise.
+
+    """
+    if self.driver.is_element_on_screen(
+      By.CSS_SELECTOR, "div.icon-br_sad.empty-state-icon + div.empty-state-text h2.ng-binding"
+    ):
+      self.logger.info("No offers found at all!")
+      return True
+
+    try:
+      item_offer_pairs: List[Tuple[WebElement, HousingOffer]] = [
+        pair for pair in self._harvest_offers(location_url) if not pair[1].responded
+      ]
+      detected_at: float = time.monotonic()
+
+      new_housing_offers: List[Tuple[WebElement, Any]] = self._apply_filters(
+        item_offer_pairs, filters, self._prefetch_offer
+      )
+
+      if not new_housing_offers:
+        self.logger.info("No new offers found")
+      else:
+        self.logger.info("Found %d new offers matching the filters", len(new_housing_offers))
+        reply_queue: ReplyQueue[WebElement] = ReplyQueue(score)
+        for raw_item, offer in new_housing_offers:
+          reply_queue.push(raw_item, offer, detected_at)
+
+        for rank, offer_score, offer_detected_at, raw_item, offer in reply_queue.drain():
+          try:
+            self._reply(raw_item, offer)
+            self.logger.info(
+              "Replied to rank %d (score %.1f) %.2fs after detection",
+              rank,
+              offer_score,
+              time.monotonic() - offer_detected_at,
+            )
+          except Exception as e:
+            self.logger.exception("Failed to reply to offer!", exc_info=e)
+
+    except TimeoutException:
+      self.logger.warning("List container or items not found on the page")
+      return False
+    except NoSuchElementException:
+      self.logger.warning("List container or items not found on the page")
+      return False
+    except StaleElementReferenceException:
+      self.logger.warning("The result list changed while it was being read")
+      return False
+    finally:
+      if self.reply_session is not None:
+        self.reply_session.discard_prefetched()
+
+    return True
+
+  def _probe_changed(self, probe: ConditionalProbe) -> Optional[bool]:
+    """Ask the probe whether the listing changed.
+
+    Args:
+      probe (ConditionalProbe): The change probe.
+
+    Returns:
+      Optional[bool]: Whether the listing changed, or None if the probe failed.
+
+    """
+    try:
+      return probe.has_changed(self.driver.get_cookies())
+    except (OSError, ValueError, http.client.HTTPException) as e:
+      self.logger.warning("Change probe failed, refreshing anyway: %s", e)
+      return None
+
+  def _fetch(self, probe: Optional[ConditionalProbe], governor: RateGovernor) -> bool:
+    """Refresh the listing page unless the probe reports it unchanged.
+
+    The governor is told one outcome per cycle: an error if the probe or the refresh
+    failed, and otherwise a success carrying the latency of the browser refresh only, so
+    the quick probe round trip does not hide slow page loads.
+
+    Args:
+      probe (Optional[ConditionalProbe]): The change probe, if one is configured.
+      governor (RateGovernor): The governor informed of the cycle outcome.
+
+    Returns:
+      bool: True if the page was refreshed and should be polled, False otherwise.
+
+    """
+    changed: Optional[bool] = True if probe is None else self._probe_changed(probe)
+    if changed is False:
+      governor.record_success()
+      self.logger.info("Listing unchanged, skipping refresh")
+      return False
+
+    start: float = time.monotonic()
+    try:
+      self.driver.refresh()
+    except TimeoutException as e:
+      governor.record_error()
+      self.logger.warning("Failed to fetch the listing: %s", e)
+      return False
+
+    if changed is None:
+      governor.record_error()
+    else:
+      governor.record_success(time.monotonic() - start)
+    self.logger.info("Page refreshed")
+    return True
+
   def _monitor_and_reply(self) -> None:
     """Monitor the target URL for new items and replies to them."""
     location_url: str = self._generate_location_url(self.config["target"]["city"])
     filters: Dict[str, Callable[[HousingOffer], bool]] = self._parse_filters(self.config)
-    poll_interval: int = self.config["poll_interval"]
+    score: Callable[[HousingOffer], float] = self._parse_ranking(self.config)
+    governor: RateGovernor = RateGovernor.from_config(self.config, self.logger)
+    probe: Optional[ConditionalProbe] = self._build_probe()
 
     self.driver.get(location_url)
+    fetched: bool = True
 
     while True:
-      if self.driver.is_element_on_screen(
-        By.CSS_SELECTOR, "div.icon-br_sad.empty-state-icon + div.empty-state-text h2.ng-binding"
-      ):
-        self.logger.info("No offers found at all!")
-      else:
-        try:
-          list_container = self.driver.wait_for_element_to_be_visible(
-            By.CSS_SELECTOR, "div.object-list-items-container"
-          )
+      previous_config: Dict[str, Any] = self.config
+      changed, restarted = self._apply_pending_config()
+      if changed:
+        new_location_url: str = self._generate_location_url(self.config["target"]["city"])
+        filters = self._parse_filters(self.config)
+        score = self._parse_ranking(self.config)
+        # Rebuilding would drop the backoff and the validators the site expects back
+        if self._pacing(self.config) != self._pacing(previous_config):
+          governor = RateGovernor.from_config(self.config, self.logger)
+        if self._probe_url(self.config) != self._probe_url(previous_config):
+          probe = self._build_probe()
+        if restarted or self.config.get("reply_session") != self._reply_session_config:
+          self._start_reply_session()
+        if restarted or new_location_url != location_url:
+          location_url = new_location_url
+          self.driver.get(location_url)
+          fetched = True
+
+      if fetched:
+        with profiler.poll("plaza"):
+          if not self._poll(location_url, filters, score):
+            governor.record_error()
+
+      self._wait_for_next_poll(governor.interval)
+      fetched = self._fetch(probe, governor)
 
-          raw_items: List[WebElement] = list_container.find_elements(
-            By.CSS_SELECTOR, "section.list-item"
-          )
+  @staticmethod
+  def _pacing(config: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Return the settings the rate governor is built from.
 
-          item_offer_pairs: List[Tuple[WebElement, Any]] = list(
-            filter(
-              lambda pair: not pair[1].responded,
-              [
-                (raw_item, self._serialize_str_to_housing_offer(raw_item.text))
-                for raw_item in raw_items
-              ],
-            )
-          )
+    Args:
+      config (Dict[str, Any]): The configuration section of the bot.
 
-          new_housing_offers: List[Tuple[WebElement, Any]] = self._apply_filters(
-            item_offer_pairs, filters
-          )
+    Returns:
+      Tuple[Any, Any]: The ``poll_interval`` and ``polling`` settings.
 
-          if not new_housing_offers:
-            self.logger.info("No new offers found")
-          else:
-            self.logger.info("Found %d new offers matching the filters", len(new_housing_offers))
-            for raw_item, offer in new_housing_offers:
-              try:
-                self._reply(raw_item, offer)
-              except Exception as e:
-                self.logger.exception("Failed to reply to offer!", exc_info=e)
-
-        except TimeoutException:
-          self.logger.warning("List container or items not found on the page")
-        except NoSuchElementException:
-          self.logger.warning("List container or items not found on the page")
-
-      time.sleep(poll_interval)
-      self.driver.refresh()
-      self.logger.info("Page refreshed")
+    """
+    return config.get("poll_interval"), config.get("polling")
+
+  @staticmethod
+  def _probe_url(config: Dict[str, Any]) -> Optional[str]:
+    """Return the ``polling.probe_url`` setting, if present.
+
+    Args:
+      config (Dict[str, Any]): The configuration section of the bot.
+
+    Returns:
+      Optional[str]: The probe URL, or None if none is configured.
+
+    """
+    return (config.get("polling", {}) or {}).get("probe_url")
+
+  def _build_probe(self) -> Optional[ConditionalProbe]:
+    """Create the change probe from the ``polling.probe_url`` setting, if present.
+
+    Returns:
+      Optional[ConditionalProbe]: The probe, or None if no probe URL is configured.
+
+    """
+    probe_url: Optional[str] = self._probe_url(self.config)
+    return ConditionalProbe(probe_url, self.logger) if probe_url else None
 
   def run(self) -> None:
     """Run the bot."""
     try:
       self._login()
+      self._start_reply_session()
       self._monitor_and_reply()
     except Exception as e:
       self.logger.exception("An error occurred while running the Plaza Bot", exc_info=e)
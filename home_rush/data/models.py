@@ -28,6 +28,7 @@ class HousingOffer:
   address: Address = dataclasses.field(default_factory=Address)
   property_profile: PropertyProfile = dataclasses.field(default_factory=PropertyProfile)
   responded: bool = False
+  url: str = ""
 
   def __str__(self) -> str:
     return f"{self.address} | Basic price: {self.monthly_price} | Total price: {self.total_price}"
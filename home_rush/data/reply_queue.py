@@ -0,0 +1,56 @@
+"""Priority queue ordering the replies to matching offers."""
+
+import heapq
+import itertools
+import time
+
+from typing import Callable, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+from home_rush.data.models import HousingOffer
+
+T = TypeVar("T")
+
+
+class ReplyQueue(Generic[T]):
+  """Priority queue handing out matching offers best score first.
+
+  Offers with equal scores keep the order in which they were pushed, so without a
+  scoring function the queue behaves like the page order.
+  """
+
+  def __init__(self, score: Callable[[HousingOffer], float]) -> None:
+    """Initialize the queue.
+
+    Args:
+      score (Callable[[HousingOffer], float]): Ranks an offer; higher is replied to first.
+
+    """
+    self.score = score
+    self._counter = itertools.count()
+    self._heap: List[Tuple[float, int, float, T, HousingOffer]] = []
+
+  def push(self, item: T, offer: HousingOffer, detected_at: Optional[float] = None) -> None:
+    """Add an offer to the queue.
+
+    Args:
+      item (T): The handle used to reply to the offer, e.g. its web element.
+      offer (HousingOffer): The offer to rank.
+      detected_at (Optional[float]): ``time.monotonic()`` when the offer was first seen.
+
+    """
+    detected_at = time.monotonic() if detected_at is None else detected_at
+    heapq.heappush(self._heap, (-self.score(offer), next(self._counter), detected_at, item, offer))
+
+  def drain(self) -> Iterator[Tuple[int, float, float, T, HousingOffer]]:
+    """Pop every offer, best first.
+
+    Yields:
+      Tuple[int, float, float, T, HousingOffer]: The 1-based rank, the score, the detection
+        time, the reply handle and the offer.
+
+    """
+    rank = 0
+    while self._heap:
+      negative_score, _, detected_at, item, offer = heapq.heappop(self._heap)
+      rank += 1
+      yield rank, -negative_score, detected_at, item, offer
@@ -7,36 +7,63 @@ import yaml
 from home_rush.bots.abstract_bot import AbstractHousingBot
 from home_rush.bots.holland2stay_bot import Holland2StayBot
 from home_rush.bots.plaza_bot import PlazaBot
-from home_rush.utils.logging import setup_logging
+from home_rush.utils.config_watcher import ConfigWatcher, validate_config
+from home_rush.utils.logging import setup_logging, shutdown_logging
+from home_rush.utils.profiling import profiler
 
+CONFIG_PATH = "config.yaml"
 
-def load_config() -> Dict[str, Any]:
-  """Load configuration from config.yaml."""
-  with open("config.yaml", encoding="utf-8") as file:
+
+def load_config(path: str = CONFIG_PATH) -> Dict[str, Any]:
+  """Load configuration from a YAML file, config.yaml by default."""
+  with open(path, encoding="utf-8") as file:
     return yaml.safe_load(file)
 
 
+def _apply_config(bots: List[AbstractHousingBot], config: Dict[str, Any]) -> None:
+  """Hand a reloaded configuration to every running bot."""
+  for bot in bots:
+    bot.update_config(config)
+
+
+def _create_bots(config: Dict[str, Any], logger: Logger) -> List[AbstractHousingBot]:
+  """Create a bot for every agency configured."""
+  bots: List[AbstractHousingBot] = []
+
+  if config.get("plaza"):
+    bots.append(PlazaBot(config, logger))
+
+  if config.get("holland2stay"):
+    bots.append(Holland2StayBot(config, logger))
+
+  if not bots:
+    raise ValueError("No bot configured")
+
+  return bots
+
+
 def main() -> None:
-  logger: Logger = setup_logging()
   config: Dict[str, Any] = load_config()
+  validate_config(config)
+  logger: Logger = setup_logging(config.get("logging"))
+  profiler.configure(config.get("profiling"), logger)
 
   executor: ThreadPoolExecutor = ThreadPoolExecutor()
   futures: List[Future[None]] = []
   bots: List[AbstractHousingBot] = []
+  watcher: ConfigWatcher = ConfigWatcher(
+    CONFIG_PATH, load_config, lambda new_config: _apply_config(bots, new_config), logger
+  )
 
   try:
-    if config.get("plaza"):
-      bots.append(PlazaBot(config, logger))
-
-    if config.get("holland2stay"):
-      bots.append(Holland2StayBot(config, logger))
-
-    if not bots:
-      raise ValueError("No bot configured")
+    bots.extend(_create_bots(config, logger))
 
     for bot in bots:
       futures.append(executor.submit(bot.run))
 
+    if config.get("watch_config", True):
+      watcher.start()
+
     for future in futures:
       future.result()
 
@@ -49,10 +76,13 @@ def main() -> None:
     logger.exception("An error occurred", exc_info=e)
   finally:
     logger.info("Cleaning up resources...")
+    watcher.stop()
     for bot in bots:
       del bot
     executor.shutdown(wait=False)
+    profiler.shutdown()
     logger.info("Shutdown complete")
+    shutdown_logging()
 
 
 if __name__ == "__main__":
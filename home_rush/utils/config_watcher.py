@@ -0,0 +1,282 @@
+"""Validation and live reloading of the configuration file."""
+
+import logging
+import threading
+
+from logging import Logger
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+BOT_SECTIONS = ("plaza", "holland2stay")
+FILTER_FIELDS = ("rent", "total_rent", "floor", "size")
+
+
+class ConfigError(ValueError):
+  """Raised when the configuration is malformed."""
+
+  def __init__(self, key: str, reason: str) -> None:
+    """Initialize the error.
+
+    Args:
+      key (str): The dotted path of the offending setting, e.g. "plaza.poll_interval".
+      reason (str): What is wrong with it.
+
+    """
+    super().__init__(f"{key} {reason}")
+
+
+def _require(condition: bool, key: str, reason: str) -> None:
+  """Raise a ``ConfigError`` for ``key`` unless ``condition`` holds.
+
+  Args:
+    condition (bool): Whether the setting is valid.
+    key (str): The dotted path of the setting.
+    reason (str): What is wrong with it when invalid.
+
+  Raises:
+    ConfigError: If ``condition`` is false.
+
+  """
+  if not condition:
+    raise ConfigError(key, reason)
+
+
+def _is_number(value: object) -> bool:
+  """Check whether a value is an int or a float, but not a bool."""
+  return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_positive(value: object) -> bool:
+  """Check whether a value is a strictly positive number."""
+  return _is_number(value) and value > 0
+
+
+def _validate_login(name: str, section: Dict[str, Any]) -> None:
+  """Validate the ``login`` settings of a bot."""
+  login = section.get("login")
+  _require(
+    isinstance(login, dict) and all(login.get(key) for key in ("url", "username", "password")),
+    f"{name}.login",
+    "must define url, username and password",
+  )
+
+
+def _validate_target(name: str, section: Dict[str, Any]) -> None:
+  """Validate the ``target`` settings of a bot."""
+  target = section.get("target")
+  _require(isinstance(target, dict), f"{name}.target", "must be a mapping")
+
+  city = target.get("city")
+  _require(
+    isinstance(city, list) and len(city) == 2,
+    f"{name}.target.city",
+    "must be a [city, province] pair",
+  )
+
+
+def _validate_filters(name: str, section: Dict[str, Any]) -> None:
+  """Validate the ``target.filters`` settings of a bot."""
+  filters = section["target"].get("filters", {}) or {}
+  _require(isinstance(filters, dict), f"{name}.target.filters", "must be a mapping")
+  _require(
+    isinstance(filters.get("complexes", []), list),
+    f"{name}.target.filters.complexes",
+    "must be a list",
+  )
+
+  for field in FILTER_FIELDS:
+    bounds = filters.get(field) or {}
+    _require(isinstance(bounds, dict), f"{name}.target.filters.{field}", "must be a mapping")
+    for op, value in bounds.items():
+      _require(
+        op in ("eq", "min", "max") and _is_number(value),
+        f"{name}.target.filters.{field}.{op}",
+        "must be eq/min/max with a number",
+      )
+
+
+def _validate_poll_interval(name: str, section: Dict[str, Any]) -> None:
+  """Validate the ``poll_interval`` setting of a bot."""
+  _require(
+    _is_positive(section.get("poll_interval")),
+    f"{name}.poll_interval",
+    "must be a positive number",
+  )
+
+
+def _validate_polling(name: str, section: Dict[str, Any]) -> None:
+  """Validate the ``polling`` settings of a bot."""
+  polling = section.get("polling", {}) or {}
+  _require(isinstance(polling, dict), f"{name}.polling", "must be a mapping")
+
+  for key, value in polling.items():
+    _require(
+      key == "probe_url" or _is_positive(value),
+      f"{name}.polling.{key}",
+      "must be a positive number",
+    )
+
+  _require(polling.get("backoff", 2.0) > 1, f"{name}.polling.backoff", "must be greater than 1")
+
+  poll_interval = section["poll_interval"]
+  _require(
+    polling.get("min_interval", poll_interval) <= polling.get("max_interval", poll_interval * 10),
+    f"{name}.polling.min_interval",
+    "must not exceed max_interval",
+  )
+
+
+def _validate_ranking(name: str, section: Dict[str, Any]) -> None:
+  """Validate the ``target.ranking`` settings of a bot."""
+  ranking = section["target"].get("ranking", {}) or {}
+  _require(isinstance(ranking, dict), f"{name}.target.ranking", "must be a mapping")
+
+  for key in ("weights", "complexes"):
+    scores = ranking.get(key, {}) or {}
+    _require(
+      isinstance(scores, dict) and all(_is_number(value) for value in scores.values()),
+      f"{name}.target.ranking.{key}",
+      "must map names to numbers",
+    )
+
+  unknown = set(ranking.get("weights", {}) or {}) - set(FILTER_FIELDS)
+  _require(not unknown, f"{name}.target.ranking.weights", f"has unknown fields: {sorted(unknown)}")
+
+
+def _validate_reply_session(name: str, section: Dict[str, Any]) -> None:
+  """Validate the ``reply_session`` settings of a bot."""
+  reply_session = section.get("reply_session", {}) or {}
+  _require(isinstance(reply_session, dict), f"{name}.reply_session", "must be a mapping")
+  _require(
+    _is_positive(reply_session.get("keep_alive_interval", 120)),
+    f"{name}.reply_session.keep_alive_interval",
+    "must be a positive number",
+  )
+
+
+def _validate_logging(config: Dict[str, Any]) -> None:
+  """Validate the top-level ``logging`` section."""
+  section = config.get("logging", {}) or {}
+  _require(isinstance(section, dict), "logging", "must be a mapping")
+  _require(
+    isinstance(logging.getLevelName(str(section.get("level", "INFO")).upper()), int),
+    "logging.level",
+    "must be a level name such as DEBUG, INFO or WARNING",
+  )
+  _require(
+    _is_number(section.get("dedup_interval", 30)) and section.get("dedup_interval", 30) >= 0,
+    "logging.dedup_interval",
+    "must be a number of seconds, 0 to disable",
+  )
+  _require(
+    isinstance(section.get("file", ""), str) or section["file"] is None,
+    "logging.file",
+    "must be a path",
+  )
+
+
+SECTION_VALIDATORS: Tuple[Callable[[str, Dict[str, Any]], None], ...] = (
+  _validate_login,
+  _validate_target,
+  _validate_filters,
+  _validate_ranking,
+  _validate_poll_interval,
+  _validate_polling,
+  _validate_reply_session,
+)
+
+
+def validate_config(config: object) -> None:
+  """Validate a loaded configuration.
+
+  Args:
+    config (object): The parsed contents of the configuration file.
+
+  Raises:
+    ConfigError: If the configuration is malformed.
+
+  """
+  _require(isinstance(config, dict), "configuration", "must be a mapping")
+
+  selenium = config.get("selenium")
+  _require(
+    isinstance(selenium, dict) and "headless" in selenium, "selenium.headless", "must be set"
+  )
+
+  _validate_logging(config)
+
+  configured = [name for name in BOT_SECTIONS if config.get(name)]
+  _require(bool(configured), "configuration", "must configure at least one bot")
+
+  if "plaza" in configured:
+    for validator in SECTION_VALIDATORS:
+      validator("plaza", config["plaza"])
+
+
+class ConfigWatcher:
+  """Watch the configuration file and hand validated changes to a callback."""
+
+  def __init__(
+    self,
+    path: str,
+    loader: Callable[[str], Dict[str, Any]],
+    on_change: Callable[[Dict[str, Any]], None],
+    logger: Logger,
+    interval: float = 2.0,
+  ) -> None:
+    """Initialize the watcher.
+
+    Args:
+      path (str): The configuration file to watch.
+      loader (Callable[[str], Dict[str, Any]]): Parses the file at the given path.
+      on_change (Callable[[Dict[str, Any]], None]): Called with each new valid configuration.
+      logger (Logger): The logger used to report reloads and validation errors.
+      interval (float): Seconds between two checks of the file.
+
+    """
+    self.path = Path(path)
+    self.loader = loader
+    self.on_change = on_change
+    self.logger = logger
+    self.interval = interval
+    self._stop = threading.Event()
+    self._thread: Optional[threading.Thread] = None
+    self._mtime = self._current_mtime()
+
+  def _current_mtime(self) -> Optional[float]:
+    """Return the modification time of the watched file, or None if it is missing."""
+    try:
+      return self.path.stat().st_mtime
+    except OSError:
+      return None
+
+  def _check(self) -> None:
+    """Reload the file if it changed since the last check."""
+    mtime = self._current_mtime()
+    if mtime is None or mtime == self._mtime:
+      return
+    self._mtime = mtime
+
+    try:
+      config = self.loader(str(self.path))
+      validate_config(config)
+    except Exception as e:
+      self.logger.warning("Ignoring invalid configuration change in %s: %s", self.path, e)
+      return
+
+    self.logger.info("Configuration file %s changed, applying", self.path)
+    self.on_change(config)
+
+  def _watch(self) -> None:
+    """Check the file until stopped."""
+    while not self._stop.wait(self.interval):
+      self._check()
+
+  def start(self) -> None:
+    """Start watching in a background thread."""
+    self._thread = threading.Thread(target=self._watch, name="config-watcher", daemon=True)
+    self._thread.start()
+
+  def stop(self) -> None:
+    """Stop watching."""
+    self._stop.set()
@@ -1,4 +1,14 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import math
+import queue
+import threading
+import time
+
+from typing import Any, Dict, List, Optional, Tuple
 
 from colorama import Fore, Style, init
 
@@ -22,17 +32,186 @@ class ColoredFormatter(logging.Formatter):
     return f"{self.formatTime(record, '%H:%M:%S')} | {log_level_name} | {log_message}"
 
 
-def setup_logging() -> logging.Logger:
-  """Set up logging with a custom formatter."""
+class JsonLinesFormatter(logging.Formatter):
+  """Formatter writing each record as a single JSON object."""
+
+  def format(self, record: logging.LogRecord) -> str:
+    """Format the record as a JSON object on a single line."""
+    entry: Dict[str, Any] = {
+      "time": record.created,
+      "level": record.levelname,
+      "thread": record.threadName,
+      "message": record.getMessage(),
+    }
+    if getattr(record, "suppressed", 0):
+      entry["suppressed"] = record.suppressed
+    return json.dumps(entry, ensure_ascii=False)
+
+
+class DeduplicatingFilter(logging.Filter):
+  """Rate-limit repeats of the same warning or error emitted within a time window.
+
+  Records are keyed by their logger, level, fully formatted message and exception type,
+  so a burst of identical failures (e.g. the same malformed listing on every poll, or the
+  same reply failing for every offer) is logged once per window, traceback included. The
+  next repeat that gets through, or ``pending`` on shutdown, reports how many were
+  dropped. Dropped records are never formatted, so their tracebacks cost nothing.
+  """
+
+  def __init__(self, interval: float) -> None:
+    """Initialize the filter.
+
+    Args:
+      interval (float): Seconds during which repeats of a record are suppressed.
+
+    """
+    super().__init__()
+    self.interval = interval
+    self._lock = threading.Lock()
+    self._seen: Dict[Tuple[str, int, str, str], Tuple[float, int, logging.LogRecord]] = {}
+    self._last_prune = -math.inf
+
+  @staticmethod
+  def _key(record: logging.LogRecord) -> Tuple[str, int, str, str]:
+    """Return the key identifying repeats of a record."""
+    exc_type = record.exc_info[0].__name__ if record.exc_info and record.exc_info[0] else ""
+    return record.name, record.levelno, record.getMessage(), exc_type
+
+  def _prune(self, now: float) -> None:
+    """Forget records whose window expired and that have no unreported repeats.
+
+    Must be called with the lock held.
+
+    Args:
+      now (float): The current ``time.monotonic()``.
+
+    """
+    if now - self._last_prune < self.interval:
+      return
+    self._last_prune = now
+    expired = [
+      key
+      for key, (last, suppressed, _) in self._seen.items()
+      if not suppressed and now - last >= self.interval
+    ]
+    for key in expired:
+      del self._seen[key]
+
+  def filter(self, record: logging.LogRecord) -> bool:
+    """Return False for a warning or error already logged within the window."""
+    if record.levelno < logging.WARNING:
+      return True
+
+    key = self._key(record)
+    now = time.monotonic()
+    with self._lock:
+      self._prune(now)
+      last, suppressed, _ = self._seen.get(key, (-math.inf, 0, record))
+      if now - last < self.interval:
+        # Keep a copy without the traceback, so the frames it references can be freed
+        summary = copy.copy(record)
+        summary.exc_info = summary.exc_text = summary.stack_info = None
+        self._seen[key] = (last, suppressed + 1, summary)
+        return False
+      self._seen[key] = (now, 0, record)
+
+    if suppressed:
+      record.suppressed = suppressed
+      record.msg = f"{record.msg} (repeated {suppressed} more times)"
+    return True
+
+  def pending(self) -> List[logging.LogRecord]:
+    """Return summary records for repeats that were dropped and not reported yet.
+
+    Returns:
+      List[logging.LogRecord]: One record per warning or error with unreported repeats.
+
+    """
+    records: List[logging.LogRecord] = []
+    with self._lock:
+      for key, (last, suppressed, record) in self._seen.items():
+        if not suppressed:
+          continue
+        summary = copy.copy(record)
+        summary.msg = f"{record.getMessage()} (repeated {suppressed} more times)"
+        summary.args = None
+        summary.suppressed = suppressed
+        records.append(summary)
+        self._seen[key] = (last, 0, record)
+    return records
+
+
+class _Pipeline:
+  """The running queue listener, and what is needed to flush it on shutdown."""
+
+  def __init__(self) -> None:
+    """Initialize an empty, stopped pipeline."""
+    self.listener: Optional[logging.handlers.QueueListener] = None
+    self.queue_handler: Optional[logging.handlers.QueueHandler] = None
+    self.dedup_filter: Optional[DeduplicatingFilter] = None
+
+
+_pipeline = _Pipeline()
+
+
+def setup_logging(config: Optional[Dict[str, Any]] = None) -> logging.Logger:
+  """Set up logging with a custom formatter.
+
+  Records are handed to a queue and formatted and written on a background thread, so
+  logging never blocks the bots on console or file I/O.
+
+  Args:
+    config (Optional[Dict[str, Any]]): The ``logging`` section of the configuration.
+
+  Returns:
+    logging.Logger: The configured logger.
+
+  """
+  config = config or {}
+  level = logging.getLevelName(str(config.get("level", "INFO")).upper())
+
   logger = logging.getLogger(__name__)
-  logger.setLevel(logging.INFO)
+  logger.setLevel(level)
 
   console_handler = logging.StreamHandler()
-  console_handler.setLevel(logging.INFO)
+  console_handler.setLevel(level)
+  console_handler.setFormatter(ColoredFormatter("%(message)s"))
+  handlers = [console_handler]
+
+  if config.get("file"):
+    file_handler = logging.FileHandler(config["file"], encoding="utf-8")
+    file_handler.setLevel(level)
+    file_handler.setFormatter(JsonLinesFormatter())
+    handlers.append(file_handler)
+
+  log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+  queue_handler = logging.handlers.QueueHandler(log_queue)
+  dedup_filter: Optional[DeduplicatingFilter] = None
+  dedup_interval = float(config.get("dedup_interval", 30))
+  if dedup_interval > 0:
+    dedup_filter = DeduplicatingFilter(dedup_interval)
+    queue_handler.addFilter(dedup_filter)
 
-  formatter = ColoredFormatter("%(message)s")
-  console_handler.setFormatter(formatter)
+  logger.addHandler(queue_handler)
 
-  logger.addHandler(console_handler)
+  listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+  listener.start()
+  _pipeline.listener = listener
+  _pipeline.queue_handler = queue_handler
+  _pipeline.dedup_filter = dedup_filter
+  atexit.register(shutdown_logging)
 
   return logger
+
+
+def shutdown_logging() -> None:
+  """Report pending repeat counts, flush queued records and stop the logging thread."""
+  if _pipeline.listener is None:
+    return
+
+  if _pipeline.dedup_filter is not None:
+    for record in _pipeline.dedup_filter.pending():
+      _pipeline.queue_handler.emit(record)
+
+  _pipeline.listener.stop()
+  _pipeline.listener = None
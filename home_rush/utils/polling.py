@@ -0,0 +1,179 @@
+"""Conditional change probing and adaptive pacing of polls."""
+
+import hashlib
+import urllib.error
+import urllib.request
+
+from logging import Logger
+from typing import Any, Dict, Optional
+
+
+class ConditionalProbe:
+  """Cheaply check whether a resource changed using conditional HTTP requests.
+
+  The ``ETag`` and ``Last-Modified`` validators of the previous response are sent back as
+  ``If-None-Match`` and ``If-Modified-Since``, so an unchanged resource costs a bodiless
+  ``304``. Servers that send no validators are compared by a hash of the body instead.
+  """
+
+  def __init__(self, url: str, logger: Logger, timeout: float = 10.0) -> None:
+    """Initialize the probe.
+
+    Args:
+      url (str): The resource to probe, e.g. the JSON endpoint behind the listing page.
+      logger (Logger): The logger used to report probe results.
+      timeout (float): Seconds to wait for a response.
+
+    """
+    self.url = url
+    self.logger = logger
+    self.timeout = timeout
+    self._etag: Optional[str] = None
+    self._last_modified: Optional[str] = None
+    self._digest: Optional[str] = None
+
+  def has_changed(self, cookies: Optional[Dict[str, str]] = None) -> bool:
+    """Check whether the resource changed since the previous call.
+
+    Args:
+      cookies (Optional[Dict[str, str]]): Session cookies to send along, if any.
+
+    Returns:
+      bool: True if the resource changed (or on the first call), False otherwise.
+
+    Raises:
+      urllib.error.URLError: If the request fails or the server answers with an error.
+
+    """
+    request = urllib.request.Request(self.url)  # noqa: S310
+    if self._etag:
+      request.add_header("If-None-Match", self._etag)
+    if self._last_modified:
+      request.add_header("If-Modified-Since", self._last_modified)
+    if cookies:
+      request.add_header("Cookie", "; ".join(f"{key}={value}" for key, value in cookies.items()))
+
+    try:
+      with urllib.request.urlopen(request, timeout=self.timeout) as response:  # noqa: S310
+        body: bytes = response.read()
+        etag: Optional[str] = response.headers.get("ETag")
+        last_modified: Optional[str] = response.headers.get("Last-Modified")
+    except urllib.error.HTTPError as e:
+      if e.code == 304:
+        self.logger.debug("Probe of %s: not modified", self.url)
+        return False
+      raise
+
+    self._etag, self._last_modified = etag, last_modified
+    digest: str = hashlib.sha256(body).hexdigest()
+    changed: bool = digest != self._digest
+    self._digest = digest
+    self.logger.debug("Probe of %s: %s", self.url, "changed" if changed else "unchanged")
+    return changed
+
+
+class RateGovernor:
+  """Adapt the poll rate with additive-increase/multiplicative-decrease (AIMD).
+
+  Every healthy poll raises the rate by a fixed step, up to ``1 / min_interval``. An error,
+  or a smoothed response latency above ``latency_threshold``, divides the rate by
+  ``backoff``, down to ``1 / max_interval``. The rate therefore settles just below what the
+  site tolerates, and backs off quickly when it starts throttling.
+  """
+
+  def __init__(
+    self,
+    interval: float,
+    min_interval: float,
+    max_interval: float,
+    logger: Logger,
+    latency_threshold: float = 10.0,
+    increase: float = 0.1,
+    backoff: float = 2.0,
+  ) -> None:
+    """Initialize the governor.
+
+    Args:
+      interval (float): The initial seconds between two polls.
+      min_interval (float): The shortest allowed interval, i.e. the highest rate.
+      max_interval (float): The longest allowed interval, i.e. the lowest rate.
+      logger (Logger): The logger used to report backoffs.
+      latency_threshold (float): Smoothed latency in seconds above which the site is
+        considered overloaded.
+      increase (float): Polls per minute added to the rate after each healthy poll.
+      backoff (float): Factor the rate is divided by after an error or a slow response.
+
+    """
+    self.min_rate = 1 / max_interval
+    self.max_rate = 1 / min_interval
+    self.rate = min(max(1 / interval, self.min_rate), self.max_rate)
+    self.logger = logger
+    self.latency_threshold = latency_threshold
+    self.increase = increase / 60
+    self.backoff = backoff
+    self.latency: Optional[float] = None
+    self.error_rate = 0.0
+
+  @classmethod
+  def from_config(cls, config: Dict[str, Any], logger: Logger) -> "RateGovernor":
+    """Create a governor from a bot configuration section.
+
+    Without a ``polling`` section the bot never polls faster than ``poll_interval``.
+
+    Args:
+      config (Dict[str, Any]): The configuration section of the bot.
+      logger (Logger): The logger used to report backoffs.
+
+    Returns:
+      RateGovernor: The configured governor.
+
+    """
+    poll_interval: float = config["poll_interval"]
+    polling: Dict[str, Any] = config.get("polling", {}) or {}
+    return cls(
+      poll_interval,
+      polling.get("min_interval", poll_interval),
+      polling.get("max_interval", poll_interval * 10),
+      logger,
+      latency_threshold=polling.get("latency_threshold", 10.0),
+      increase=polling.get("increase", 0.1),
+      backoff=polling.get("backoff", 2.0),
+    )
+
+  @property
+  def interval(self) -> float:
+    """The seconds to wait before the next poll."""
+    return 1 / self.rate
+
+  def _slow_down(self, reason: str) -> None:
+    """Apply the multiplicative decrease.
+
+    Args:
+      reason (str): Why the rate is reduced, for the log.
+
+    """
+    self.rate = max(self.rate / self.backoff, self.min_rate)
+    self.logger.warning("%s, backing off to one poll every %.0fs", reason, self.interval)
+
+  def record_success(self, latency: Optional[float] = None) -> None:
+    """Record a successful poll and adjust the rate.
+
+    Args:
+      latency (Optional[float]): The seconds the page load took, or None if the poll did
+        not load the page (e.g. the listing was unchanged), which leaves the latency
+        average as it is.
+
+    """
+    if latency is not None:
+      self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+    self.error_rate *= 0.8
+
+    if self.latency is not None and self.latency > self.latency_threshold:
+      self._slow_down(f"Responses are slow ({self.latency:.1f}s on average)")
+    else:
+      self.rate = min(self.rate + self.increase, self.max_rate)
+
+  def record_error(self) -> None:
+    """Record a failed poll and back off."""
+    self.error_rate = 0.8 * self.error_rate + 0.2
+    self._slow_down(f"Request failed (error rate {self.error_rate:.0%})")
@@ -0,0 +1,346 @@
+"""Opt-in profiling for running bots.
+
+Two tools are provided, both disabled unless a ``profiling`` section is present in the config:
+
+- A sampling profiler that walks the stacks of every bot thread for a fixed number of seconds
+  and writes them in the folded format understood by ``flamegraph.pl`` and speedscope.
+- A per-poll ``cProfile`` recorder that keeps the slowest poll cycles it has seen so they can be
+  dumped on demand.
+
+Both can be triggered with POSIX signals (``SIGUSR1`` samples, ``SIGUSR2`` dumps the slowest
+polls) or through a small HTTP server bound to localhost.
+"""
+
+import contextlib
+import cProfile
+import heapq
+import itertools
+import math
+import os
+import signal
+import sys
+import threading
+import time
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import Logger
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+def _parse_seconds(value: str) -> Optional[float]:
+  """Parse the ``seconds`` query parameter of the HTTP trigger.
+
+  Args:
+    value (str): The raw parameter, empty if it was not given.
+
+  Returns:
+    Optional[float]: The duration in seconds, or None if it was not given.
+
+  Raises:
+    ValueError: If the value is not a positive, finite number.
+
+  """
+  if not value:
+    return None
+  seconds = float(value)
+  if not 0 < seconds < math.inf:
+    raise ValueError(value)
+  return seconds
+
+
+class SamplingProfiler:
+  """Low-overhead stack sampler covering all threads of the process."""
+
+  def __init__(self, interval: float, logger: Logger) -> None:
+    """Initialize the sampler.
+
+    Args:
+      interval (float): Seconds between two samples.
+      logger (Logger): The logger used to report progress.
+
+    """
+    self.interval = interval
+    self.logger = logger
+    self._lock = threading.Lock()
+    self._thread: Optional[threading.Thread] = None
+
+  @staticmethod
+  def _fold_stack(frame: Optional[FrameType]) -> str:
+    """Convert a frame chain into a single folded stack line (root first).
+
+    Args:
+      frame (Optional[FrameType]): The innermost frame of a thread.
+
+    Returns:
+      str: The frames joined by ``;``.
+
+    """
+    names: List[str] = []
+    while frame is not None:
+      code = frame.f_code
+      names.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+      frame = frame.f_back
+    return ";".join(reversed(names))
+
+  def _sample(self, duration: float, output: Path) -> None:
+    """Collect stack samples for ``duration`` seconds and write them to ``output``.
+
+    Args:
+      duration (float): How long to sample for, in seconds.
+      output (Path): The file the folded stacks are written to.
+
+    """
+    own_ident = threading.get_ident()
+    stacks: Counter[str] = Counter()
+    deadline = time.monotonic() + duration
+
+    while time.monotonic() < deadline:
+      names = {thread.ident: thread.name for thread in threading.enumerate()}
+      # No public API exposes the frames of other threads
+      for ident, frame in sys._current_frames().items():  # noqa: SLF001
+        if ident == own_ident:
+          continue
+        stacks[f"{names.get(ident, ident)};{self._fold_stack(frame)}"] += 1
+      time.sleep(self.interval)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", encoding="utf-8") as file:
+      for stack, count in stacks.items():
+        file.write(f"{stack} {count}\n")
+
+    self.logger.info("Wrote %d sampled stacks to %s", sum(stacks.values()), output)
+
+  def start(self, duration: float, output: Path) -> bool:
+    """Start sampling in a background thread.
+
+    Args:
+      duration (float): How long to sample for, in seconds.
+      output (Path): The file the folded stacks are written to.
+
+    Returns:
+      bool: True if sampling started, False if a sampling run is already in progress.
+
+    """
+    with self._lock:
+      if self._thread is not None and self._thread.is_alive():
+        return False
+
+      self.logger.info("Sampling all threads for %.1fs", duration)
+      self._thread = threading.Thread(
+        target=self._sample, args=(duration, output), name="profiling-sampler", daemon=True
+      )
+      self._thread.start()
+      return True
+
+
+class SlowPollRecorder:
+  """Profile poll cycles with ``cProfile`` and keep the slowest ones."""
+
+  def __init__(self, keep: int, logger: Logger) -> None:
+    """Initialize the recorder.
+
+    Args:
+      keep (int): How many of the slowest poll profiles to retain.
+      logger (Logger): The logger used to report progress.
+
+    """
+    self.keep = keep
+    self.logger = logger
+    self._lock = threading.Lock()
+    # cProfile cannot be enabled from two threads at once, so only one poll is profiled at a time
+    self._profiling = threading.Lock()
+    self._counter = itertools.count()
+    self._slowest: List[Tuple[float, int, str, cProfile.Profile]] = []
+
+  @contextlib.contextmanager
+  def record(self, name: str) -> Iterator[None]:
+    """Profile the wrapped block and retain it if it is among the slowest seen.
+
+    Args:
+      name (str): A label for the profiled block, usually the bot name.
+
+    """
+    if not self._profiling.acquire(blocking=False):
+      yield
+      return
+
+    profile = cProfile.Profile()
+    start = time.perf_counter()
+    try:
+      profile.enable()
+      try:
+        yield
+      finally:
+        profile.disable()
+    finally:
+      self._profiling.release()
+
+    elapsed = time.perf_counter() - start
+    entry = (elapsed, next(self._counter), name, profile)
+    with self._lock:
+      if len(self._slowest) < self.keep:
+        heapq.heappush(self._slowest, entry)
+      elif elapsed > self._slowest[0][0]:
+        heapq.heapreplace(self._slowest, entry)
+
+  def dump(self, output_dir: Path) -> List[Path]:
+    """Write the retained profiles to ``output_dir`` as ``.prof`` files.
+
+    Args:
+      output_dir (Path): The directory to write the profiles to.
+
+    Returns:
+      List[Path]: The written files, slowest first.
+
+    """
+    with self._lock:
+      entries = sorted(self._slowest, reverse=True)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    paths: List[Path] = []
+    for rank, (elapsed, _, name, profile) in enumerate(entries, start=1):
+      path = output_dir / f"poll-{stamp}-{rank:02d}-{name}-{elapsed * 1000:.0f}ms.prof"
+      profile.dump_stats(path)
+      paths.append(path)
+
+    self.logger.info("Dumped %d slow poll profiles to %s", len(paths), output_dir)
+    return paths
+
+
+class Profiler:
+  """Entry point tying the sampler, the poll recorder and their triggers together."""
+
+  def __init__(self) -> None:
+    """Initialize a disabled profiler; call ``configure`` to enable it."""
+    self.enabled = False
+    self.output_dir = Path("profiles")
+    self.duration = 30.0
+    self.logger: Optional[Logger] = None
+    self.sampler: Optional[SamplingProfiler] = None
+    self.recorder: Optional[SlowPollRecorder] = None
+    self._server: Optional[ThreadingHTTPServer] = None
+
+  def configure(self, config: Optional[Dict[str, Any]], logger: Logger) -> None:
+    """Enable profiling from the ``profiling`` config section.
+
+    Args:
+      config (Optional[Dict[str, Any]]): The ``profiling`` section, or None to stay disabled.
+      logger (Logger): The logger used to report progress.
+
+    """
+    if not config or not config.get("enabled", True):
+      return
+
+    self.enabled = True
+    self.logger = logger
+    self.output_dir = Path(config.get("output_dir", "profiles"))
+    self.duration = float(config.get("duration", 30))
+    self.sampler = SamplingProfiler(float(config.get("sample_interval", 0.01)), logger)
+    if config.get("slow_polls", 5):
+      self.recorder = SlowPollRecorder(int(config.get("slow_polls", 5)), logger)
+
+    if config.get("signals", True) and hasattr(signal, "SIGUSR1"):
+      signal.signal(signal.SIGUSR1, lambda *_: self.sample())
+      signal.signal(signal.SIGUSR2, lambda *_: self.dump_slow_polls())
+      logger.info(
+        "Profiling signals installed: kill -USR1 %d to sample, -USR2 to dump slow polls",
+        os.getpid(),
+      )
+
+    if config.get("http_port"):
+      self._start_server(int(config["http_port"]))
+
+  def _start_server(self, port: int) -> None:
+    """Serve ``/sample?seconds=N`` and ``/slow-polls`` on localhost.
+
+    Args:
+      port (int): The port to listen on.
+
+    """
+    profiler = self
+
+    class _Handler(BaseHTTPRequestHandler):
+      def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path == "/sample":
+          try:
+            seconds = _parse_seconds(parse_qs(url.query).get("seconds", [""])[0])
+          except ValueError:
+            self.send_error(400, "seconds must be a positive number")
+            return
+          path = profiler.sample(seconds)
+          body = f"{path}\n" if path else "sampling already in progress\n"
+        elif url.path == "/slow-polls":
+          body = "".join(f"{path}\n" for path in profiler.dump_slow_polls())
+        else:
+          self.send_error(404)
+          return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+
+      def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        profiler.logger.debug("Profiling HTTP: %s", format % args)
+
+    self._server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+    threading.Thread(target=self._server.serve_forever, name="profiling-http", daemon=True).start()
+    self.logger.info("Profiling HTTP trigger listening on http://127.0.0.1:%d", port)
+
+  def sample(self, duration: Optional[float] = None) -> Optional[Path]:
+    """Start a sampling run across all threads.
+
+    Args:
+      duration (Optional[float]): Seconds to sample for; defaults to the configured duration.
+
+    Returns:
+      Optional[Path]: The file the stacks will be written to, or None if not started.
+
+    """
+    if not self.enabled:
+      return None
+
+    output = self.output_dir / f"stacks-{time.strftime('%Y%m%d-%H%M%S')}.folded"
+    if self.sampler.start(duration or self.duration, output):
+      return output
+    return None
+
+  def dump_slow_polls(self) -> List[Path]:
+    """Write the slowest recorded poll profiles to the output directory.
+
+    Returns:
+      List[Path]: The written files, slowest first.
+
+    """
+    if not self.enabled or self.recorder is None:
+      return []
+    return self.recorder.dump(self.output_dir)
+
+  def poll(self, name: str) -> contextlib.AbstractContextManager[None]:
+    """Return a context manager profiling one poll cycle, or a no-op when disabled.
+
+    Args:
+      name (str): A label for the poll, usually the bot name.
+
+    Returns:
+      contextlib.AbstractContextManager[None]: The context manager to wrap the poll in.
+
+    """
+    if not self.enabled or self.recorder is None:
+      return contextlib.nullcontext()
+    return self.recorder.record(name)
+
+  def shutdown(self) -> None:
+    """Stop the HTTP trigger if it is running."""
+    if self._server is not None:
+      self._server.shutdown()
+      self._server = None
+
+
+profiler = Profiler()
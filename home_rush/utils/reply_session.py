@@ -0,0 +1,221 @@
+"""A dedicated, pre-authenticated browser kept warm for replying."""
+
+import contextlib
+import threading
+
+from logging import Logger
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from home_rush.utils.web_driver_adapter import WebDriverAdapter
+
+
+class ReplySession:
+  """Second browser that stays logged in and preloads offers before replying to them.
+
+  The session periodically reloads its page so the login and the connections to the site
+  stay warm. Detail pages of matching offers are opened in background tabs as soon as they
+  are found, so replying only needs the final click.
+
+  A browser that fails, or that the site logged out, is dropped and replaced by the
+  keep-alive thread; until then the session is not ``ready``. The replacement is opened
+  and logged in without holding the lock, so polling is never blocked by a login.
+  Prefetching is best effort and skipped while the keep-alive holds the lock.
+  """
+
+  def __init__(
+    self,
+    selenium_config: Dict[str, Any],
+    login: Callable[[WebDriverAdapter], None],
+    is_logged_in: Callable[[WebDriverAdapter], bool],
+    logger: Logger,
+    keep_alive_interval: float = 120.0,
+  ) -> None:
+    """Initialize the session; call ``start`` to open the browser.
+
+    Args:
+      selenium_config (Dict[str, Any]): The selenium options for the browser.
+      login (Callable[[WebDriverAdapter], None]): Logs the given driver in.
+      is_logged_in (Callable[[WebDriverAdapter], bool]): Checks whether the page shown by
+        the given driver belongs to a logged in session.
+      logger (Logger): The logger used to report the session state.
+      keep_alive_interval (float): Seconds between two keep-alive checks.
+
+    """
+    self.selenium_config = selenium_config
+    self.login = login
+    self.is_logged_in = is_logged_in
+    self.logger = logger
+    self.keep_alive_interval = keep_alive_interval
+    self.driver: Optional[WebDriverAdapter] = None
+    self._lock = threading.Lock()
+    self._stop = threading.Event()
+    self._wake = threading.Event()
+    self._home_tab = ""
+    self._prefetched: Dict[str, str] = {}
+
+  @property
+  def ready(self) -> bool:
+    """Whether the browser is open and can be used to reply."""
+    return self.driver is not None
+
+  def start(self) -> None:
+    """Open and log in the browser, then start the keep-alive thread."""
+    self._install(self._open())
+    threading.Thread(target=self._keep_alive, name="reply-session-keep-alive", daemon=True).start()
+    self.logger.info("Reply session ready")
+
+  def _open(self) -> WebDriverAdapter:
+    """Open a new browser and log it in, without touching the current one.
+
+    Returns:
+      WebDriverAdapter: The logged in driver.
+
+    """
+    # Own debugging port (0 lets Chrome pick a free one), so it never clashes with the
+    # listing browser.
+    driver = WebDriverAdapter({**self.selenium_config, "remote_debugging_port": 0})
+    try:
+      self.login(driver)
+    except Exception:
+      with contextlib.suppress(Exception):
+        driver.quit()
+      raise
+    return driver
+
+  def _install(self, driver: WebDriverAdapter) -> None:
+    """Swap a logged in driver in, unless the session was stopped meanwhile.
+
+    Args:
+      driver (WebDriverAdapter): The driver to use from now on.
+
+    """
+    with self._lock:
+      if not self._stop.is_set():
+        self.driver, driver = driver, None
+        self._home_tab = self.driver.get_current_tab()
+        self._prefetched.clear()
+
+    if driver is not None:
+      driver.quit()
+
+  def _drop(self) -> None:
+    """Stop using the current browser and quit it outside the lock."""
+    with self._lock:
+      driver, self.driver = self.driver, None
+      self._prefetched.clear()
+
+    if driver is not None:
+      with contextlib.suppress(Exception):
+        driver.quit()
+
+  def _keep_alive(self) -> None:
+    """Check the session every ``keep_alive_interval`` seconds, or when woken, until stopped."""
+    while True:
+      self._wake.wait(self.keep_alive_interval)
+      self._wake.clear()
+      if self._stop.is_set():
+        return
+      self._ensure_logged_in()
+
+  def _is_healthy(self) -> bool:
+    """Reload the page of the current browser and check that it is still logged in.
+
+    Returns:
+      bool: True if the browser works and is logged in, False otherwise.
+
+    """
+    with self._lock:
+      if self.driver is None:
+        return False
+      try:
+        self.driver.refresh()
+        if self.is_logged_in(self.driver):
+          return True
+        self.logger.warning("Reply session was logged out, logging in again")
+      except Exception as e:
+        self.logger.warning("Reply session keep-alive failed, reopening it: %s", e)
+      return False
+
+  def _ensure_logged_in(self) -> None:
+    """Replace the browser with a freshly logged in one if it failed or was logged out."""
+    if self._is_healthy():
+      return
+
+    self._drop()
+    try:
+      driver = self._open()
+    except Exception as e:
+      self.logger.warning("Failed to reopen the reply session, retrying later: %s", e)
+      return
+    self._install(driver)
+    self.logger.info("Reply session ready")
+
+  def restart(self) -> None:
+    """Drop a failing browser and have the keep-alive thread reopen it right away."""
+    self._drop()
+    self._wake.set()
+
+  def prefetch(self, url: str) -> None:
+    """Start loading a page in a background tab, unless it is already loaded.
+
+    Skipped while the browser is busy or closed; ``open`` loads the page instead.
+
+    Args:
+      url (str): The page to preload.
+
+    """
+    if not self._lock.acquire(blocking=False):
+      return
+    try:
+      if self.driver is not None and url not in self._prefetched:
+        self._prefetched[url] = self.driver.open_tab(url)
+    finally:
+      self._lock.release()
+
+  @contextlib.contextmanager
+  def open(self, url: str) -> Iterator[WebDriverAdapter]:
+    """Switch to the tab showing ``url``, opening it if it was not prefetched.
+
+    The tab is closed when the block exits.
+
+    Args:
+      url (str): The page to switch to.
+
+    Yields:
+      WebDriverAdapter: The driver, focused on the requested page.
+
+    Raises:
+      RuntimeError: If the browser is closed, e.g. while it is being reopened.
+
+    """
+    with self._lock:
+      if self.driver is None:
+        message = "The reply session browser is closed"
+        raise RuntimeError(message)
+      tab: str = self._prefetched.pop(url, "") or self.driver.open_tab(url)
+      try:
+        self.driver.switch_to_tab(tab)
+        yield self.driver
+      finally:
+        self.driver.close_tab(tab, self._home_tab)
+
+  def discard_prefetched(self) -> None:
+    """Close the tabs of prefetched pages that were not used.
+
+    Skipped while the browser is busy; the tabs are then closed by a later call.
+    """
+    if not self._lock.acquire(blocking=False):
+      return
+    try:
+      if self.driver is not None:
+        for tab in self._prefetched.values():
+          self.driver.close_tab(tab, self._home_tab)
+      self._prefetched.clear()
+    finally:
+      self._lock.release()
+
+  def stop(self) -> None:
+    """Stop the keep-alive thread and close the browser."""
+    self._stop.set()
+    self._wake.set()
+    self._drop()
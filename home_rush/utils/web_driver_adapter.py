@@ -16,6 +16,8 @@ class WebDriverAdapter:
 
     Args:
       config (Dict[str, Any]): A dictionary containing configuration settings for Selenium WebDriver.
+        In headless mode, ``remote_debugging_port`` sets the DevTools port (9222 by default,
+        0 for a free one, None to disable it).
 
     Sets up the Chrome WebDriver with specified options based on the configuration.
 
@@ -26,7 +28,9 @@ class WebDriverAdapter:
       options.add_argument("--no-sandbox")
       options.add_argument("--disable-dev-shm-usage")
       options.add_argument("--disable-gpu")
-      options.add_argument("--remote-debugging-port=9222")
+      port = config.get("remote_debugging_port", 9222)
+      if port is not None:
+        options.add_argument(f"--remote-debugging-port={port}")
       options.add_argument("--disable-setuid-sandbox")
       options.add_argument("--disable-software-rasterizer")
       options.add_argument("--disable-extensions")
@@ -51,6 +55,15 @@ class WebDriverAdapter:
     """
     return self.driver.current_url
 
+  def get_cookies(self) -> Dict[str, str]:
+    """Get the cookies of the current browser session.
+
+    Returns:
+      Dict[str, str]: The cookie values keyed by name.
+
+    """
+    return {cookie["name"]: cookie["value"] for cookie in self.driver.get_cookies()}
+
   def find_element(self, by: By, value: str) -> WebElement:
     """Find a single web element on the page.
 
@@ -151,6 +164,94 @@ class WebDriverAdapter:
     """Dismiss any open dialogs."""
     self.driver.execute_script("document.body.click();")
 
+  def scroll_to_bottom(self) -> None:
+    """Scroll the browser window to the bottom of the page."""
+    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+
+  def is_scrolled_to_bottom(self) -> bool:
+    """Check whether the bottom of the page is already in view.
+
+    Returns:
+      bool: True if scrolling down would not reveal anything, False otherwise.
+
+    """
+    return self.driver.execute_script(
+      "return window.innerHeight + window.scrollY >= document.body.scrollHeight;"
+    )
+
+  def wait_for_element_count_change(
+    self, parent: WebElement, by: By, value: str, count: int, timeout: float
+  ) -> List[WebElement]:
+    """Wait until the number of matching elements below a parent differs from ``count``.
+
+    Args:
+      parent (WebElement): The element to search in.
+      by (By): The method to locate the elements (e.g., By.CLASS_NAME, By.CSS_SELECTOR).
+      value (str): The value to search for using the specified method.
+      count (int): The number of elements found before.
+      timeout (float): The maximum number of seconds to wait.
+
+    Returns:
+      List[WebElement]: The matching elements, unchanged if the timeout expired.
+
+    """
+
+    def changed(_: webdriver.Chrome) -> List[WebElement]:
+      elements = parent.find_elements(by, value)
+      return elements if len(elements) != count else []
+
+    try:
+      return WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(changed)
+    except TimeoutException:
+      return parent.find_elements(by, value)
+
+  def get_current_tab(self) -> str:
+    """Get the handle of the tab the WebDriver is currently controlling.
+
+    Returns:
+      str: The window handle of the current tab.
+
+    """
+    return self.driver.current_window_handle
+
+  def open_tab(self, url: str) -> str:
+    """Open a URL in a new background tab without waiting for it to load.
+
+    The WebDriver keeps controlling the current tab, so several tabs can be opened
+    back to back and load concurrently.
+
+    Args:
+      url (str): The URL to open.
+
+    Returns:
+      str: The window handle of the new tab.
+
+    """
+    handles = set(self.driver.window_handles)
+    self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+    return next(handle for handle in self.driver.window_handles if handle not in handles)
+
+  def switch_to_tab(self, handle: str) -> None:
+    """Switch the WebDriver to another tab.
+
+    Args:
+      handle (str): The window handle of the tab to switch to.
+
+    """
+    self.driver.switch_to.window(handle)
+
+  def close_tab(self, handle: str, return_to: str) -> None:
+    """Close a tab and switch back to another one.
+
+    Args:
+      handle (str): The window handle of the tab to close.
+      return_to (str): The window handle of the tab to switch to afterwards.
+
+    """
+    self.driver.switch_to.window(handle)
+    self.driver.close()
+    self.driver.switch_to.window(return_to)
+
   def back(self) -> None:
     """Navigate back to the previous page in the browser history."""
     self.driver.back()
@@ -0,0 +1,106 @@
+import copy
+import logging
+import re
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+import yaml
+
+from home_rush.utils.config_watcher import ConfigError, ConfigWatcher, validate_config
+
+VALID_CONFIG: Dict[str, Any] = {
+  "plaza": {
+    "login": {"url": "https://example.com", "username": "user", "password": "secret"},
+    "target": {
+      "city": ["Delft", "Zuid-Holland"],
+      "filters": {"complexes": ["Street"], "rent": {"max": 800}},
+    },
+    "poll_interval": 60,
+  },
+  "selenium": {"headless": True},
+}
+
+
+def _config(**plaza: Any) -> Dict[str, Any]:
+  config = copy.deepcopy(VALID_CONFIG)
+  config["plaza"].update(plaza)
+  return config
+
+
+def test_valid_config_passes():
+  validate_config(VALID_CONFIG)
+
+
+@pytest.mark.parametrize(
+  ("config", "key"),
+  [
+    ({"selenium": {"headless": True}}, "configuration"),
+    ({**VALID_CONFIG, "selenium": {}}, "selenium.headless"),
+    (_config(login={"url": "https://example.com"}), "plaza.login"),
+    (_config(target={"city": ["Delft"]}), "plaza.target.city"),
+    (
+      _config(target={"city": ["Delft", "ZH"], "filters": {"rent": {"max": "800"}}}),
+      "plaza.target",
+    ),
+    (_config(target={"city": ["Delft", "ZH"], "filters": {"size": {"avg": 30}}}), "plaza.target"),
+    (
+      _config(target={"city": ["Delft", "ZH"], "ranking": {"weights": {"price": -1}}}),
+      "plaza.target.ranking.weights",
+    ),
+    (_config(poll_interval=0), "plaza.poll_interval"),
+    ({**VALID_CONFIG, "logging": {"level": "FOO"}}, "logging.level"),
+    ({**VALID_CONFIG, "logging": {"dedup_interval": -1}}, "logging.dedup_interval"),
+    (_config(polling={"backoff": 1}), "plaza.polling.backoff"),
+    (_config(reply_session={"keep_alive_interval": 0}), "plaza.reply_session.keep_alive_interval"),
+    (_config(polling={"min_interval": 120, "max_interval": 60}), "plaza.polling.min_interval"),
+  ],
+)
+def test_invalid_config_is_rejected(config: Dict[str, Any], key: str):
+  with pytest.raises(ConfigError, match=re.escape(key)):
+    validate_config(config)
+
+
+def test_config_error_is_a_value_error():
+  with pytest.raises(ValueError, match=r"plaza\.poll_interval"):
+    validate_config(_config(poll_interval=-1))
+
+
+def _watcher(path: Path, applied: List[Dict[str, Any]]) -> ConfigWatcher:
+  path.write_text(yaml.safe_dump(VALID_CONFIG), encoding="utf-8")
+  watcher = ConfigWatcher(
+    str(path), lambda p: yaml.safe_load(Path(p).read_text()), applied.append, logging.getLogger()
+  )
+  watcher._mtime = None
+  return watcher
+
+
+def test_watcher_applies_valid_change(tmp_path: Path):
+  applied: List[Dict[str, Any]] = []
+  watcher = _watcher(tmp_path / "config.yaml", applied)
+
+  watcher._check()
+
+  assert applied == [VALID_CONFIG]
+
+
+def test_watcher_ignores_invalid_change(tmp_path: Path):
+  applied: List[Dict[str, Any]] = []
+  path = tmp_path / "config.yaml"
+  watcher = _watcher(path, applied)
+  path.write_text(yaml.safe_dump(_config(poll_interval=-5)), encoding="utf-8")
+
+  watcher._check()
+
+  assert applied == []
+
+
+def test_watcher_skips_unchanged_file(tmp_path: Path):
+  applied: List[Dict[str, Any]] = []
+  watcher = _watcher(tmp_path / "config.yaml", applied)
+
+  watcher._check()
+  watcher._check()
+
+  assert len(applied) == 1
@@ -0,0 +1,98 @@
+import logging
+import sys
+
+from home_rush.utils.logging import DeduplicatingFilter
+
+
+def _record(msg: str, *args: object, level: int = logging.WARNING) -> logging.LogRecord:
+  return logging.LogRecord("home_rush", level, __file__, 1, msg, args, None)
+
+
+def _error(msg: str, error: Exception) -> logging.LogRecord:
+  try:
+    raise error
+  except type(error):
+    return logging.LogRecord("home_rush", logging.ERROR, __file__, 1, msg, (), sys.exc_info())
+
+
+def test_repeated_warning_is_dropped_within_window():
+  dedup = DeduplicatingFilter(interval=60)
+
+  assert dedup.filter(_record("Failed to convert size to float: %r", "x"))
+  assert not dedup.filter(_record("Failed to convert size to float: %r", "x"))
+
+
+def test_warnings_with_different_arguments_are_kept():
+  dedup = DeduplicatingFilter(interval=60)
+
+  assert dedup.filter(_record("Failed to convert size to float: %r", "x"))
+  assert dedup.filter(_record("Failed to convert size to float: %r", "y"))
+
+
+def test_repeated_errors_are_rate_limited():
+  dedup = DeduplicatingFilter(interval=60)
+
+  assert dedup.filter(_error("Failed to reply to offer!", TimeoutError()))
+  assert not dedup.filter(_error("Failed to reply to offer!", TimeoutError()))
+
+
+def test_errors_with_different_exception_types_are_kept():
+  dedup = DeduplicatingFilter(interval=60)
+
+  assert dedup.filter(_error("Failed to reply to offer!", TimeoutError()))
+  assert dedup.filter(_error("Failed to reply to offer!", KeyError()))
+
+
+def test_info_is_never_dropped():
+  dedup = DeduplicatingFilter(interval=60)
+
+  assert dedup.filter(_record("Page refreshed", level=logging.INFO))
+  assert dedup.filter(_record("Page refreshed", level=logging.INFO))
+
+
+def test_suppressed_error_summary_has_no_traceback():
+  dedup = DeduplicatingFilter(interval=60)
+  dedup.filter(_error("Failed to reply to offer!", TimeoutError()))
+  dedup.filter(_error("Failed to reply to offer!", TimeoutError()))
+
+  (summary,) = dedup.pending()
+  assert summary.exc_info is None
+  assert summary.getMessage() == "Failed to reply to offer! (repeated 1 more times)"
+
+
+def test_expired_entries_without_repeats_are_pruned():
+  dedup = DeduplicatingFilter(interval=60)
+  dedup.filter(_record("Failed to convert size to float: %r", "x"))
+  dedup.filter(_record("Failed to convert size to float: %r", "y"))
+  dedup.filter(_record("Failed to convert size to float: %r", "y"))
+  dedup.interval = 0
+
+  dedup.filter(_record("Failed to convert size to float: %r", "z"))
+
+  assert [key[2] for key in dedup._seen] == [
+    "Failed to convert size to float: 'y'",
+    "Failed to convert size to float: 'z'",
+  ]
+
+
+def test_next_warning_after_window_reports_repeats():
+  dedup = DeduplicatingFilter(interval=60)
+  dedup.filter(_record("slow"))
+  dedup.filter(_record("slow"))
+  dedup.filter(_record("slow"))
+  dedup.interval = 0
+
+  record = _record("slow")
+  assert dedup.filter(record)
+  assert record.suppressed == 2
+  assert record.getMessage() == "slow (repeated 2 more times)"
+
+
+def test_pending_reports_unflushed_repeats_once():
+  dedup = DeduplicatingFilter(interval=60)
+  dedup.filter(_record("Failed to convert size to float: %r", "x"))
+  dedup.filter(_record("Failed to convert size to float: %r", "x"))
+
+  (summary,) = dedup.pending()
+  assert summary.getMessage() == "Failed to convert size to float: 'x' (repeated 1 more times)"
+  assert dedup.pending() == []
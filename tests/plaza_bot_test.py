@@ -0,0 +1,217 @@
+import logging
+import math
+
+from typing import Dict, List, Optional
+
+import pytest
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from home_rush.bots.plaza_bot import PlazaBot
+from home_rush.data.models import HousingOffer
+from home_rush.utils.polling import RateGovernor
+
+LOCATION_URL = "https://plaza.newnewnew.space/aanbod/wonen#?gesorteerd-op=zoekprofiel&locatie=Delft"
+
+
+class _Element:
+  """Web element stub exposing its text and child elements."""
+
+  def __init__(self, text: str = "", children: List["_Element"] = ()) -> None:
+    self.text = text
+    self.children = list(children)
+
+  def find_elements(self, by: str, value: str) -> List["_Element"]:
+    return self.children
+
+  def find_element(self, by: str, value: str) -> "_Element":
+    raise NoSuchElementException(value)
+
+
+class _Driver:
+  """Driver stub serving a fixed list of elements and counting scrolls."""
+
+  def __init__(self, elements: List[_Element], at_bottom: bool = True) -> None:
+    self.elements = elements
+    self.at_bottom = at_bottom
+    self.scrolls = 0
+    self.refreshes = 0
+
+  def find_elements(self, by: str, value: str) -> List[_Element]:
+    return self.elements
+
+  def wait_for_element_to_be_visible(self, by: str, value: str) -> _Element:
+    return _Element(children=self.elements)
+
+  def is_scrolled_to_bottom(self) -> bool:
+    return self.at_bottom
+
+  def scroll_to_bottom(self) -> None:
+    self.scrolls += 1
+
+  def wait_for_element_count_change(
+    self, parent: _Element, by: str, value: str, count: int, timeout: float
+  ) -> List[_Element]:
+    return parent.find_elements(by, value)
+
+  def get_cookies(self) -> Dict[str, str]:
+    return {}
+
+  def refresh(self) -> None:
+    self.refreshes += 1
+
+  def quit(self) -> None:
+    pass
+
+
+def _bot(driver: _Driver) -> PlazaBot:
+  bot = PlazaBot.__new__(PlazaBot)
+  bot.driver = driver
+  bot.logger = logging.getLogger("home_rush")
+  return bot
+
+
+def _offer(street: str, url: str = "") -> HousingOffer:
+  offer = HousingOffer(url=url)
+  offer.address.street = street
+  return offer
+
+
+def test_page_url_appends_page_parameter():
+  bot = _bot(_Driver([]))
+
+  assert bot._page_url(LOCATION_URL, 3) == f"{LOCATION_URL}&pagina=3"
+
+
+@pytest.mark.parametrize(
+  ("labels", "expected"),
+  [([], 1), (["1", "2", "3", "Volgende"], 3), (["1", " 12 ", "2", "…"], 12)],
+)
+def test_page_count_is_highest_page_link(labels: List[str], expected: int):
+  bot = _bot(_Driver([_Element(label) for label in labels]))
+
+  assert bot._get_page_count() == expected
+
+
+def test_deduplicate_keeps_first_occurrence_by_url():
+  first = (_Element("1"), _offer("A", "https://plaza/offer/1"))
+  repeated = (_Element("2"), _offer("A (moved)", "https://plaza/offer/1"))
+  other = (_Element("3"), _offer("B", "https://plaza/offer/2"))
+
+  assert PlazaBot._deduplicate([first, repeated, other]) == [first, other]
+
+
+def test_deduplicate_falls_back_to_description_without_url():
+  first = (_Element("1"), _offer("A"))
+  same = (_Element("2"), _offer("A"))
+  other = (_Element("3"), _offer("B"))
+
+  assert PlazaBot._deduplicate([first, same, other]) == [first, other]
+
+
+def test_complete_page_is_read_without_scrolling():
+  driver = _Driver([_Element("€ 700 p/m"), _Element("€ 800 p/m")])
+
+  offers = [offer for _, offer in _bot(driver)._read_offers()]
+
+  assert driver.scrolls == 0
+  assert [offer.monthly_price for offer in offers] == [700, 800]
+
+
+def test_page_with_more_below_is_scrolled():
+  driver = _Driver([_Element("€ 700 p/m")], at_bottom=False)
+
+  _bot(driver)._read_offers()
+
+  assert driver.scrolls == 1
+
+
+@pytest.mark.parametrize("field", ["rent", "total_rent", "size"])
+def test_offer_missing_weighted_field_sinks(field: str):
+  score = _bot(_Driver([]))._parse_ranking({"target": {"ranking": {"weights": {field: -1}}}})
+
+  assert score(_offer("A")) == -math.inf
+
+
+def test_ground_floor_is_ranked_normally():
+  score = _bot(_Driver([]))._parse_ranking(
+    {"target": {"ranking": {"weights": {"rent": -1, "floor": 10}, "complexes": {"A": 50}}}}
+  )
+  offer = _offer("A")
+  offer.monthly_price = 700
+
+  assert score(offer) == -650
+
+
+class _Probe:
+  """Change probe stub returning a fixed answer, or raising it."""
+
+  def __init__(self, answer: object) -> None:
+    self.answer = answer
+
+  def has_changed(self, cookies: Optional[Dict[str, str]] = None) -> bool:
+    if isinstance(self.answer, Exception):
+      raise self.answer
+    return self.answer
+
+
+class _Governor(RateGovernor):
+  """Rate governor recording the outcomes it is told."""
+
+  def __init__(self) -> None:
+    super().__init__(60, 20, 600, logging.getLogger("home_rush"))
+    self.outcomes: List[str] = []
+
+  def record_success(self, latency: Optional[float] = None) -> None:
+    self.outcomes.append("success" if latency is None else "refresh")
+
+  def record_error(self) -> None:
+    self.outcomes.append("error")
+
+
+@pytest.mark.parametrize(
+  ("answer", "refreshes", "outcomes"),
+  [
+    (False, 0, ["success"]),
+    (True, 1, ["refresh"]),
+    (OSError("404"), 1, ["error"]),
+  ],
+)
+def test_fetch_records_one_outcome_per_cycle(answer: object, refreshes: int, outcomes: List[str]):
+  driver = _Driver([])
+  governor = _Governor()
+
+  fetched = _bot(driver)._fetch(_Probe(answer), governor)
+
+  assert fetched == bool(refreshes)
+  assert driver.refreshes == refreshes
+  assert governor.outcomes == outcomes
+
+
+class _ReplySession:
+  """Reply session stub failing every reply with a given exception."""
+
+  ready = True
+
+  def __init__(self, error: Exception) -> None:
+    self.error = error
+    self.restarts = 0
+
+  def open(self, url: str) -> None:
+    raise self.error
+
+  def restart(self) -> None:
+    self.restarts += 1
+
+  def stop(self) -> None:
+    pass
+
+
+def test_offer_page_failure_does_not_restart_the_reply_session():
+  bot = _bot(_Driver([]))
+  bot.reply_session = _ReplySession(TimeoutException("no reply button"))
+
+  with pytest.raises(TimeoutException):
+    bot._reply(_Element(), _offer("A", "https://plaza/offer/1"))
+
+  assert bot.reply_session.restarts == 0
@@ -0,0 +1,131 @@
+import hashlib
+import logging
+import threading
+import urllib.error
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List, Tuple
+
+import pytest
+
+from home_rush.utils.polling import ConditionalProbe, RateGovernor
+
+LOGGER = logging.getLogger("home_rush")
+
+
+def test_governor_doubles_interval_on_error():
+  governor = RateGovernor(60, 20, 600, LOGGER)
+
+  governor.record_error()
+
+  assert governor.interval == pytest.approx(120)
+
+
+def test_governor_speeds_up_on_healthy_polls_until_min_interval():
+  governor = RateGovernor(60, 20, 600, LOGGER)
+
+  governor.record_success(0.5)
+  assert governor.interval < 60
+
+  for _ in range(100):
+    governor.record_success(0.5)
+  assert governor.interval == pytest.approx(20)
+
+
+def test_governor_backs_off_on_slow_responses():
+  governor = RateGovernor(60, 20, 600, LOGGER, latency_threshold=5)
+
+  governor.record_success(30)
+
+  assert governor.interval == pytest.approx(120)
+
+
+def test_governor_success_without_latency_keeps_latency_average():
+  governor = RateGovernor(60, 20, 600, LOGGER, latency_threshold=5)
+  governor.record_success(30)
+
+  governor.record_success()
+
+  assert governor.latency == 30
+  assert governor.interval == pytest.approx(240)
+
+
+def test_governor_never_exceeds_max_interval():
+  governor = RateGovernor(60, 20, 600, LOGGER)
+
+  for _ in range(10):
+    governor.record_error()
+
+  assert governor.interval == pytest.approx(600)
+
+
+def test_governor_defaults_to_poll_interval():
+  governor = RateGovernor.from_config({"poll_interval": 60}, LOGGER)
+
+  governor.record_success(0.5)
+
+  assert governor.interval == pytest.approx(60)
+
+
+class _Site:
+  """Responses served by the test server, in order, and the requests it received."""
+
+  def __init__(self, responses: List[Tuple[int, dict, bytes]]) -> None:
+    self.responses = responses
+    self.requests: List[dict] = []
+
+
+@pytest.fixture
+def site() -> Iterator[Tuple[_Site, str]]:
+  state = _Site([])
+
+  class Handler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+      state.requests.append(dict(self.headers))
+      status, headers, body = state.responses.pop(0)
+      self.send_response(status)
+      for key, value in headers.items():
+        self.send_header(key, value)
+      self.send_header("Content-Length", str(len(body)))
+      self.end_headers()
+      self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+      pass
+
+  server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  yield state, f"http://127.0.0.1:{server.server_address[1]}/offers"
+  server.shutdown()
+  server.server_close()
+
+
+def test_probe_sends_etag_and_skips_on_not_modified(site: Tuple[_Site, str]):
+  state, url = site
+  state.responses = [(200, {"ETag": '"v1"'}, b"[1]"), (304, {}, b"")]
+  probe = ConditionalProbe(url, LOGGER)
+
+  assert probe.has_changed({"session": "abc"})
+  assert not probe.has_changed({"session": "abc"})
+  assert state.requests[1]["If-None-Match"] == '"v1"'
+  assert state.requests[1]["Cookie"] == "session=abc"
+
+
+def test_probe_compares_body_without_validators(site: Tuple[_Site, str]):
+  state, url = site
+  state.responses = [(200, {}, b"[1]"), (200, {}, b"[1]"), (200, {}, b"[1, 2]")]
+  probe = ConditionalProbe(url, LOGGER)
+
+  assert probe.has_changed()
+  assert not probe.has_changed()
+  assert probe.has_changed()
+  assert probe._digest == hashlib.sha256(b"[1, 2]").hexdigest()
+
+
+def test_probe_raises_on_server_error(site: Tuple[_Site, str]):
+  state, url = site
+  state.responses = [(500, {}, b"")]
+  probe = ConditionalProbe(url, LOGGER)
+
+  with pytest.raises(urllib.error.HTTPError):
+    probe.has_changed()
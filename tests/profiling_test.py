@@ -0,0 +1,93 @@
+import logging
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from home_rush.utils.profiling import Profiler, SamplingProfiler, SlowPollRecorder, _parse_seconds
+
+LOGGER = logging.getLogger("home_rush")
+
+
+@pytest.mark.parametrize(("value", "expected"), [("", None), ("2.5", 2.5), ("10", 10.0)])
+def test_parse_seconds_accepts_positive_numbers(value: str, expected: float):
+  assert _parse_seconds(value) == expected
+
+
+@pytest.mark.parametrize("value", ["abc", "0", "-1", "inf", "nan"])
+def test_parse_seconds_rejects_invalid_values(value: str):
+  with pytest.raises(ValueError, match=re.escape(value)):
+    _parse_seconds(value)
+
+
+def test_fold_stack_is_root_first():
+  def outer() -> str:
+    return inner()
+
+  def inner() -> str:
+    return SamplingProfiler._fold_stack(sys._getframe())
+
+  frames = outer().split(";")
+
+  assert frames[-1].startswith("inner (profiling_test.py:")
+  assert frames[-2].startswith("outer (profiling_test.py:")
+
+
+def test_sample_writes_folded_stacks(tmp_path: Path):
+  stop = threading.Event()
+  worker = threading.Thread(target=stop.wait, name="worker", daemon=True)
+  worker.start()
+  output = tmp_path / "stacks.folded"
+
+  SamplingProfiler(0.005, LOGGER)._sample(0.05, output)
+  stop.set()
+
+  lines = output.read_text(encoding="utf-8").splitlines()
+  assert lines
+  assert all(re.fullmatch(r"\S.* \d+", line) for line in lines)
+  assert any(line.startswith("worker;") for line in lines)
+
+
+def test_recorder_keeps_only_the_slowest_polls(tmp_path: Path):
+  recorder = SlowPollRecorder(2, LOGGER)
+
+  for name, seconds in [("fast", 0.0), ("slowest", 0.06), ("medium", 0.01), ("slow", 0.03)]:
+    with recorder.record(name):
+      time.sleep(seconds)
+
+  paths = recorder.dump(tmp_path)
+
+  assert [re.search(r"-\d{2}-(\w+)-\d+ms", path.name)[1] for path in paths] == ["slowest", "slow"]
+  assert all(path.suffix == ".prof" and path.exists() for path in paths)
+
+
+@pytest.fixture
+def http_profiler(tmp_path: Path) -> Iterator[str]:
+  profiler = Profiler()
+  profiler.configure({"signals": False, "output_dir": str(tmp_path)}, LOGGER)
+  profiler._start_server(0)
+  yield f"http://127.0.0.1:{profiler._server.server_address[1]}"
+  profiler.shutdown()
+
+
+@pytest.mark.parametrize("seconds", ["abc", "0", "-5"])
+def test_http_sample_rejects_invalid_seconds(http_profiler: str, seconds: str):
+  with pytest.raises(urllib.error.HTTPError) as error:
+    urllib.request.urlopen(f"{http_profiler}/sample?seconds={seconds}")  # noqa: S310
+
+  assert error.value.code == 400
+
+
+def test_http_sample_starts_sampling(http_profiler: str, tmp_path: Path):
+  with urllib.request.urlopen(f"{http_profiler}/sample?seconds=0.05") as response:  # noqa: S310
+    body = response.read().decode("utf-8")
+
+  assert response.status == 200
+  assert Path(body.strip()).parent == tmp_path
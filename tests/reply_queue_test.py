@@ -0,0 +1,59 @@
+import math
+
+from typing import Dict
+
+from home_rush.data.models import HousingOffer
+from home_rush.data.reply_queue import ReplyQueue
+
+
+def _offer(street: str, rent: float) -> HousingOffer:
+  offer = HousingOffer(monthly_price=rent)
+  offer.address.street = street
+  return offer
+
+
+def test_drain_yields_best_score_first():
+  queue: ReplyQueue[str] = ReplyQueue(lambda offer: -offer.monthly_price)
+  queue.push("b", _offer("B", 900), detected_at=1.0)
+  queue.push("a", _offer("A", 700), detected_at=2.0)
+  queue.push("c", _offer("C", 1100), detected_at=3.0)
+
+  drained = [
+    (rank, score, detected_at, item) for rank, score, detected_at, item, _ in queue.drain()
+  ]
+
+  assert drained == [(1, -700, 2.0, "a"), (2, -900, 1.0, "b"), (3, -1100, 3.0, "c")]
+
+
+def test_equal_scores_keep_push_order():
+  queue: ReplyQueue[str] = ReplyQueue(lambda _: 0.0)
+  for item in ("first", "second", "third"):
+    queue.push(item, _offer(item, 800))
+
+  assert [item for _, _, _, item, _ in queue.drain()] == ["first", "second", "third"]
+
+
+def test_sunk_offers_go_last_in_push_order():
+  bonus: Dict[str, float] = {"A": 100}
+  queue: ReplyQueue[str] = ReplyQueue(
+    lambda offer: -math.inf if not offer.monthly_price else bonus.get(offer.address.street, 0.0)
+  )
+  queue.push("unparsed-1", _offer("A", 0))
+  queue.push("plain", _offer("B", 800))
+  queue.push("unparsed-2", _offer("C", 0))
+  queue.push("bonus", _offer("A", 800))
+
+  assert [item for _, _, _, item, _ in queue.drain()] == [
+    "bonus",
+    "plain",
+    "unparsed-1",
+    "unparsed-2",
+  ]
+
+
+def test_drain_empties_the_queue():
+  queue: ReplyQueue[str] = ReplyQueue(lambda _: 0.0)
+  queue.push("only", _offer("A", 800))
+
+  assert len(list(queue.drain())) == 1
+  assert list(queue.drain()) == []
@@ -0,0 +1,155 @@
+import logging
+import threading
+
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from home_rush.utils import reply_session
+from home_rush.utils.reply_session import ReplySession
+
+
+class _Driver:
+  """WebDriverAdapter stub tracking its open tabs."""
+
+  def __init__(self, config: Dict[str, Any]) -> None:
+    self.config = config
+    self.tabs: List[str] = ["home"]
+    self.current = "home"
+    self.opened: List[str] = []
+    self.refreshes = 0
+    self.quit_called = False
+
+  def get_current_tab(self) -> str:
+    return self.current
+
+  def open_tab(self, url: str) -> str:
+    self.opened.append(url)
+    self.tabs.append(url)
+    return url
+
+  def switch_to_tab(self, handle: str) -> None:
+    self.current = handle
+
+  def close_tab(self, handle: str, return_to: str) -> None:
+    self.tabs.remove(handle)
+    self.current = return_to
+
+  def refresh(self) -> None:
+    self.refreshes += 1
+
+  def quit(self) -> None:
+    self.quit_called = True
+
+
+class _Site:
+  """Login and login-check callbacks, with a switch to simulate being logged out."""
+
+  def __init__(self) -> None:
+    self.logged_in = True
+    self.logins: List[_Driver] = []
+    self.locked_during_login: List[bool] = []
+    self.session: ReplySession
+
+  def login(self, driver: _Driver) -> None:
+    self.locked_during_login.append(self.session._lock.locked())
+    self.logins.append(driver)
+    self.logged_in = True
+
+  def is_logged_in(self, driver: _Driver) -> bool:
+    return self.logged_in
+
+
+@pytest.fixture
+def site(monkeypatch: pytest.MonkeyPatch) -> Iterator[_Site]:
+  monkeypatch.setattr(reply_session, "WebDriverAdapter", _Driver)
+  state = _Site()
+  state.session = ReplySession(
+    {"headless": True}, state.login, state.is_logged_in, logging.getLogger("home_rush")
+  )
+  state.session.start()
+  yield state
+  state.session.stop()
+
+
+def test_start_logs_in_a_browser_with_its_own_debugging_port(site: _Site):
+  assert site.session.ready
+  assert site.logins == [site.session.driver]
+  assert site.session.driver.config == {"headless": True, "remote_debugging_port": 0}
+
+
+def test_open_reuses_prefetched_tab_and_closes_it(site: _Site):
+  driver = site.session.driver
+  site.session.prefetch("https://plaza/offer/1")
+  site.session.prefetch("https://plaza/offer/1")
+
+  with site.session.open("https://plaza/offer/1") as opened:
+    assert opened.current == "https://plaza/offer/1"
+
+  assert driver.opened == ["https://plaza/offer/1"]
+  assert driver.tabs == ["home"]
+  assert driver.current == "home"
+
+
+def test_discard_prefetched_closes_unused_tabs(site: _Site):
+  driver = site.session.driver
+  site.session.prefetch("https://plaza/offer/1")
+  site.session.prefetch("https://plaza/offer/2")
+
+  site.session.discard_prefetched()
+
+  assert driver.tabs == ["home"]
+
+
+def test_prefetch_is_skipped_while_the_browser_is_busy(site: _Site):
+  with site.session._lock:
+    site.session.prefetch("https://plaza/offer/1")
+
+  assert site.session.driver.opened == []
+
+
+def test_healthy_session_is_only_refreshed(site: _Site):
+  driver = site.session.driver
+
+  site.session._ensure_logged_in()
+
+  assert site.session.driver is driver
+  assert driver.refreshes == 1
+  assert len(site.logins) == 1
+
+
+def test_logged_out_session_logs_in_again_outside_the_lock(site: _Site):
+  old = site.session.driver
+  site.logged_in = False
+
+  site.session._ensure_logged_in()
+
+  assert len(site.logins) == 2
+  assert site.session.driver is site.logins[-1]
+  assert old.quit_called
+  assert site.locked_during_login == [False, False]
+
+
+def test_failed_login_leaves_session_closed_until_next_check(site: _Site):
+  def failing_login(_: _Driver) -> None:
+    raise TimeoutError
+
+  site.logged_in = False
+  site.session.login = failing_login
+
+  site.session._ensure_logged_in()
+
+  assert not site.session.ready
+  with pytest.raises(RuntimeError), site.session.open("https://plaza/offer/1"):
+    pass
+
+
+def test_restart_reopens_the_browser_from_the_keep_alive_thread(site: _Site):
+  old = site.session.driver
+  reopened = threading.Event()
+  site.session.login = lambda _: reopened.set()
+
+  site.session.restart()
+
+  assert reopened.wait(5)
+  assert old.quit_called